@@ -1,6 +1,4 @@
-import os
 import streamlit as st
-import tempfile
 import asyncio
 from typing import List, Dict, Any
 import uuid
@@ -11,6 +9,12 @@ load_dotenv()
 from workflows.models import InjestRequestDto, Message
 from workflows.injest.routes import injest_doc
 from workflows.retreival.routes import get_response
+from workflows.chat_store.utils import append_message, load_recent_messages, has_earlier_messages, clear_session
+
+# Messages rendered per page and messages passed to the model as chat context
+HISTORY_PAGE_SIZE = 50
+CONTEXT_WINDOW = 10
+NAMESPACE = 'test'
 
 # Set page configuration
 st.set_page_config(
@@ -20,8 +24,12 @@ st.set_page_config(
 )
 
 # Initialize session state
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
+if "session_id" not in st.session_state:
+    # Keep the chat session in the URL so history survives reloads and server restarts
+    st.session_state.session_id = st.query_params.get("session") or uuid.uuid4().hex
+    st.query_params["session"] = st.session_state.session_id
+if "history_limit" not in st.session_state:
+    st.session_state.history_limit = HISTORY_PAGE_SIZE
 if "namespace" not in st.session_state:
     st.session_state.namespace = f"user_{uuid.uuid4().hex[:8]}"
 if "documents" not in st.session_state:
@@ -53,7 +61,7 @@ st.markdown("""
 # Sidebar for document upload
 with st.sidebar:
     st.header("Upload Document")
-    uploaded_file = st.file_uploader("Choose a file", type=["pdf", "txt", "docx", "xlsx"])
+    uploaded_file = st.file_uploader("Choose a file", type=["pdf", "txt", "docx", "xlsx", "csv"])
 
     if uploaded_file is not None:
         file_details = {
@@ -67,49 +75,42 @@ with st.sidebar:
         # Process the uploaded file when the user clicks the button
         if st.button("Process Document"):
             with st.spinner("Processing document..."):
-                # Save the uploaded file to a temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
-                    temp_file_path = tmp_file.name
-
-                try:
-                    # Determine file type
-                    file_extension = uploaded_file.name.split('.')[-1].lower()
-                    supported_extensions = {
-                        "pdf": "pdf",
-                        "txt": "txt",
-                        "docx": "docx",
-                        "xlsx": "xlsx"
-                    }
-
-                    if file_extension not in supported_extensions:
-                        st.error(f"Unsupported file type: {file_extension}")
+                # Determine file type
+                file_extension = uploaded_file.name.split('.')[-1].lower()
+                supported_extensions = {
+                    "pdf": "pdf",
+                    "txt": "txt",
+                    "docx": "docx",
+                    "xlsx": "xlsx",
+                    "csv": "csv"
+                }
+
+                if file_extension not in supported_extensions:
+                    st.error(f"Unsupported file type: {file_extension}")
+                else:
+                    # Create request object
+                    request = InjestRequestDto(
+                        content=uploaded_file.getbuffer(),
+                        file_name=uploaded_file.name,
+                        original_file_name=uploaded_file.name,
+                        file_type=supported_extensions[file_extension],
+                        namespace=NAMESPACE
+                    )
+
+                    # Process the document
+                    result = run_async(injest_doc, request)
+
+                    if result["success"]:
+                        st.success(f"Document processed successfully! {result.get('chunks', 0)} chunks created.")
+                        if not result.get("catalog", True):
+                            st.warning("The document catalog could not be updated; listing and deleting this document may not work.")
+                        # Add to documents list
+                        st.session_state.documents.append({
+                            "name": uploaded_file.name,
+                            "namespace": st.session_state.namespace
+                        })
                     else:
-                        # Create request object
-                        request = InjestRequestDto(
-                            pre_signed_url=temp_file_path,
-                            file_name=uploaded_file.name,
-                            original_file_name=uploaded_file.name,
-                            file_type=supported_extensions[file_extension],
-                            namespace='test'
-                        )
-
-                        # Process the document
-                        result = run_async(injest_doc, request)
-
-                        if result["success"]:
-                            st.success(f"Document processed successfully! {result.get('chunks', 0)} chunks created.")
-                            # Add to documents list
-                            st.session_state.documents.append({
-                                "name": uploaded_file.name,
-                                "namespace": st.session_state.namespace
-                            })
-                        else:
-                            st.error(f"Failed to process document: {result.get('message', 'Unknown error')}")
-                finally:
-                    # Clean up the temporary file
-                    if os.path.exists(temp_file_path):
-                        os.remove(temp_file_path)
+                        st.error(f"Failed to process document: {result.get('message', 'Unknown error')}")
 
     # Display processed documents
     if st.session_state.documents:
@@ -122,9 +123,17 @@ st.header("Chat with your documents")
 
 # Display chat history in a more visually appealing way
 st.subheader("Chat History")
+chat_history = load_recent_messages(
+    st.session_state.session_id, NAMESPACE, limit=st.session_state.history_limit
+)
 chat_container = st.container()
 with chat_container:
-    if not st.session_state.chat_history:
+    if chat_history and has_earlier_messages(st.session_state.session_id, NAMESPACE, chat_history[0].id):
+        if st.button("Load earlier messages"):
+            st.session_state.history_limit += HISTORY_PAGE_SIZE
+            st.rerun()
+
+    if not chat_history:
         # Display welcome message when there's no chat history
         # st.info("""
         # 👋 Welcome to Document Chat!
@@ -135,13 +144,13 @@ with chat_container:
         # """)
         pass
     else:
-        for message in st.session_state.chat_history:
-            if message["type"] == "human":
+        for message in chat_history:
+            if message.type == "human":
                 with st.chat_message("user", avatar="🧑‍💻"):
-                    st.write(message["content"])
+                    st.write(message.content)
             else:
                 with st.chat_message("assistant", avatar="🤖"):
-                    st.write(message["content"])
+                    st.write(message.content)
 
 # Add a divider for better visual separation
 st.markdown("---")
@@ -160,15 +169,19 @@ with col1:
         with col_b:
             clear_button = st.form_submit_button("Clear Chat", use_container_width=True)
             if clear_button:
-                st.session_state.chat_history = []
+                clear_session(st.session_state.session_id, NAMESPACE)
+                st.session_state.history_limit = HISTORY_PAGE_SIZE
                 st.rerun()
 
 if submitted and user_input:
     # Add user message to chat history
-    st.session_state.chat_history.append({"type": "human", "content": user_input})
+    append_message(st.session_state.session_id, NAMESPACE, Message(type="human", content=user_input))
 
-    # Convert chat history to Message objects
-    messages = [Message(type=msg["type"], content=msg["content"]) for msg in st.session_state.chat_history]
+    # Only the most recent messages are used as chat context
+    messages = [
+        Message(type=message.type, content=message.content)
+        for message in load_recent_messages(st.session_state.session_id, NAMESPACE, limit=CONTEXT_WINDOW)
+    ]
 
     # Get response from the model
     with st.spinner("Thinking..."):
@@ -177,12 +190,12 @@ if submitted and user_input:
             question=user_input,
             language="en",
             chat_context=messages,
-            namespace='test'
+            namespace=NAMESPACE
         )
         response_content = response.get("content", "I couldn't generate a response.")
 
     # Add assistant response to chat history
-    st.session_state.chat_history.append({"type": "ai", "content": response_content})
+    append_message(st.session_state.session_id, NAMESPACE, Message(type="ai", content=response_content))
 
     # Rerun to update the UI with the new messages
     st.rerun()
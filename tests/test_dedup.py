@@ -0,0 +1,65 @@
+import pytest
+from langchain_core.documents import Document
+
+from workflows.catalog.utils import get_dependent_documents
+from workflows.dedup import DedupConfig, deduplicate_chunks, save_fingerprints
+from workflows.loader import file_loader
+
+
+@pytest.fixture(autouse=True)
+def catalog_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALOG_DB_PATH", str(tmp_path / "catalog.sqlite3"))
+
+
+def test_distinct_row_groups_survive():
+    rows = "".join(f"{i},widget,warehouse-a,in stock\n" for i in range(300))
+    chunks = file_loader(
+        file_path=f"id,item,location,status\n{rows}".encode("utf-8"),
+        file_name="inventory.csv",
+        original_file_name="inventory.csv",
+        file_type="csv",
+    )
+    assert len(chunks) == 6
+
+    kept, report, _, _ = deduplicate_chunks(chunks, "test", "ns", DedupConfig(enabled=True))
+
+    assert len(kept) == 6
+    assert report.vectors_saved == 0
+
+
+def test_repeated_boilerplate_is_dropped():
+    footer = (
+        "Confidential. This document is the property of Acme Corp and may not be distributed "
+        "without written permission from the legal department. All rights reserved."
+    )
+    sections = [" ".join(f"section{i}_word{j}" for j in range(70)) for i in range(3)]
+    text = "\n\n".join(f"{section}\n\n{footer}" for section in sections)
+    chunks = file_loader(
+        file_path=text.encode("utf-8"),
+        file_name="handbook.txt",
+        original_file_name="handbook.txt",
+        file_type="txt",
+    )
+
+    kept, report, _, _ = deduplicate_chunks(chunks, "test", "ns", DedupConfig(enabled=True))
+
+    assert report.duplicates_in_document > 0
+    assert len(kept) == len(chunks) - report.duplicates_in_document
+
+
+def test_namespace_duplicates_record_the_document_they_depend_on():
+    config = DedupConfig(enabled=True, scope="namespace")
+    shared = " ".join(f"shared_word{j}" for j in range(50))
+
+    def ingest(file_name, *texts):
+        chunks = [Document(page_content=text, metadata={"file_name": file_name}) for text in texts]
+        kept, report, fingerprints, references = deduplicate_chunks(chunks, "test", "ns", config)
+        save_fingerprints(fingerprints, references, "test", "ns")
+        return kept, report
+
+    ingest("a.pdf", shared)
+    kept, report = ingest("b.pdf", shared, " ".join(f"other_word{j}" for j in range(50)))
+
+    assert len(kept) == 1
+    assert report.referenced_documents == ["a.pdf"]
+    assert get_dependent_documents("test", "ns", "a.pdf") == ["b.pdf"]
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+from workflows.scheduler import FairScheduler, Priority
+
+
+def run_in_threads(*targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_concurrency_limit_holds_across_event_loops():
+    scheduler = FairScheduler(max_concurrency=1)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    async def work(namespace):
+        async with scheduler.slot(namespace, Priority.BULK):
+            with lock:
+                active.append(namespace)
+                peak.append(len(active))
+            await asyncio.sleep(0.05)
+            with lock:
+                active.remove(namespace)
+
+    run_in_threads(*[lambda namespace=f"ns{i}": asyncio.run(work(namespace)) for i in range(3)])
+
+    assert len(peak) == 3
+    assert max(peak) == 1
+
+
+def test_queued_work_resumes_when_another_loop_arrives():
+    scheduler = FairScheduler(max_concurrency=1)
+    finished = []
+
+    async def hold(name, seconds):
+        async with scheduler.slot(name, Priority.BULK):
+            await asyncio.sleep(seconds)
+        finished.append(name)
+
+    def late_arrival():
+        time.sleep(0.05)
+        asyncio.run(hold("late", 0.01))
+
+    run_in_threads(
+        lambda: asyncio.run(hold("first", 0.1)),
+        lambda: asyncio.run(asyncio.wait_for(hold("queued", 0.01), timeout=3)),
+        late_arrival,
+    )
+
+    assert sorted(finished) == ["first", "late", "queued"]
+    assert scheduler.metrics()["in_flight"] == 0
+
+
+def test_interactive_work_runs_before_queued_bulk_work():
+    scheduler = FairScheduler(max_concurrency=1)
+    order = []
+
+    async def record(name, priority):
+        async with scheduler.slot("ns", priority):
+            order.append(name)
+
+    async def main():
+        async with scheduler.slot("ns", Priority.BULK):
+            waiters = [
+                asyncio.create_task(record("bulk", Priority.BULK)),
+                asyncio.create_task(record("interactive", Priority.INTERACTIVE)),
+            ]
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(main())
+
+    assert order == ["interactive", "bulk"]
+
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    scheduler = FairScheduler(max_concurrency=1)
+
+    async def main():
+        async with scheduler.slot("ns", Priority.BULK):
+            waiter = asyncio.create_task(scheduler.run("ns", Priority.BULK, asyncio.sleep, 0))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+        await asyncio.wait_for(scheduler.run("ns", Priority.BULK, asyncio.sleep, 0), timeout=1)
+
+    asyncio.run(main())
+
+    assert scheduler.metrics()["in_flight"] == 0
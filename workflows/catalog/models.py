@@ -0,0 +1,37 @@
+import os
+from dataclasses import dataclass, field
+from pydantic import BaseModel
+
+from typing import Optional, List, Dict
+
+
+@dataclass
+class CatalogConfig:
+    db_path: str = field(default_factory=lambda: os.getenv("CATALOG_DB_PATH", "data/catalog.sqlite3"))
+    timeout: float = 30.0
+
+
+class CatalogDocumentDto(BaseModel):
+    """A document recorded in the local catalog."""
+    index_name: str
+    namespace: str
+    file_name: str
+    original_file_name: Optional[str] = None
+    file_type: Optional[str] = None
+    content_hash: str
+    chunk_count: int
+    byte_count: int
+    embedding_model: Optional[str] = None
+    ingested_at: str
+
+
+class NamespaceStatsDto(BaseModel):
+    """Aggregated catalog figures for one namespace."""
+    index_name: str
+    namespace: str
+    document_count: int = 0
+    chunk_count: int = 0
+    byte_count: int = 0
+    embedding_models: List[str] = []
+    file_types: Dict[str, int] = {}
+    last_ingested_at: Optional[str] = None
@@ -0,0 +1,122 @@
+from typing import Dict, Any, Optional
+
+from loguru import logger
+
+from workflows.catalog.utils import (
+    list_catalog_documents,
+    get_catalog_document,
+    get_document_chunk_ids,
+    get_namespace_stats,
+    remove_catalog_document,
+    make_document_id,
+    get_dependent_documents,
+    has_chunk_references,
+)
+from workflows.vector_db.models import PineconeConfig, DocumentIndexConfig
+from workflows.vector_db.utils import delete_vectors
+
+
+async def list_documents(
+        namespace: str,
+        index_name: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+) -> Dict[str, Any]:
+    try:
+        index_name = index_name or PineconeConfig().index_name
+        documents = list_catalog_documents(index_name, namespace, limit=limit, offset=offset)
+        return {
+            "success": True,
+            "namespace": namespace,
+            "documents": [document.model_dump() for document in documents],
+        }
+    except Exception as e:
+        logger.error(f"Error listing documents: {e}")
+        return {
+            "success": False,
+            "message": f"Error listing documents: {str(e)}",
+            "namespace": namespace,
+        }
+
+
+async def namespace_stats(
+        namespace: str,
+        index_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    try:
+        index_name = index_name or PineconeConfig().index_name
+        stats = get_namespace_stats(index_name, namespace)
+        return {"success": True, **stats.model_dump()}
+    except Exception as e:
+        logger.error(f"Error reading namespace stats: {e}")
+        return {
+            "success": False,
+            "message": f"Error reading namespace stats: {str(e)}",
+            "namespace": namespace,
+        }
+
+
+async def delete_document(
+        namespace: str,
+        file_name: str,
+        index_name: Optional[str] = None,
+        force: bool = False,
+) -> Dict[str, Any]:
+    """Delete a document's vectors and catalog entries
+
+    With namespace-scope dedup, other documents may rely on chunks that are
+    only stored as part of this one. Such a delete is refused unless forced,
+    in which case those documents lose that content from the index.
+    """
+    try:
+        index_name = index_name or PineconeConfig().index_name
+
+        if (
+                get_catalog_document(index_name, namespace, file_name) is None
+                and not has_chunk_references(index_name, namespace, file_name)
+        ):
+            return {
+                "success": False,
+                "message": f"Document {file_name} not found in namespace {namespace}",
+                "file_name": file_name,
+            }
+
+        dependents = get_dependent_documents(index_name, namespace, file_name)
+        if dependents and not force:
+            return {
+                "success": False,
+                "message": (
+                    f"Document {file_name} holds deduplicated content of {', '.join(dependents)}; "
+                    f"delete those documents first or pass force=True"
+                ),
+                "file_name": file_name,
+                "dependents": dependents,
+            }
+        if dependents:
+            logger.warning(f"Force deleting {file_name}; content of {', '.join(dependents)} is removed with it")
+
+        chunk_ids = get_document_chunk_ids(index_name, namespace, file_name)
+        deleted = delete_vectors(ids=chunk_ids, index_name=index_name, namespace=namespace)
+        delete_vectors(
+            ids=[make_document_id(namespace, file_name)],
+            index_name=index_name,
+            namespace=DocumentIndexConfig().namespace_for(namespace),
+        )
+        remove_catalog_document(index_name, namespace, file_name)
+
+        logger.info(f"Deleted document {file_name} ({deleted} chunks) from namespace: {namespace}")
+        return {
+            "success": True,
+            "message": "Document deleted successfully",
+            "file_name": file_name,
+            "namespace": namespace,
+            "chunks": deleted,
+            "dependents": dependents,
+        }
+    except Exception as e:
+        logger.error(f"Error deleting document: {e}")
+        return {
+            "success": False,
+            "message": f"Error deleting document: {str(e)}",
+            "file_name": file_name,
+        }
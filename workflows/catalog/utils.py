@@ -0,0 +1,356 @@
+import hashlib
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Dict
+
+from loguru import logger
+from langchain_core.documents import Document
+
+from workflows.catalog.models import CatalogConfig, CatalogDocumentDto, NamespaceStatsDto
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    index_name TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    original_file_name TEXT,
+    file_type TEXT,
+    content_hash TEXT NOT NULL,
+    chunk_count INTEGER NOT NULL,
+    byte_count INTEGER NOT NULL,
+    embedding_model TEXT,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (index_name, namespace, file_name)
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    index_name TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    chunk_id TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    byte_count INTEGER NOT NULL,
+    PRIMARY KEY (index_name, namespace, chunk_id)
+);
+CREATE INDEX IF NOT EXISTS chunks_by_document ON chunks (index_name, namespace, file_name);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    index_name TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    fingerprint INTEGER NOT NULL,
+    band0 INTEGER NOT NULL,
+    band1 INTEGER NOT NULL,
+    band2 INTEGER NOT NULL,
+    band3 INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fingerprints_by_document ON fingerprints (index_name, namespace, file_name);
+CREATE INDEX IF NOT EXISTS fingerprints_band0 ON fingerprints (index_name, namespace, band0);
+CREATE INDEX IF NOT EXISTS fingerprints_band1 ON fingerprints (index_name, namespace, band1);
+CREATE INDEX IF NOT EXISTS fingerprints_band2 ON fingerprints (index_name, namespace, band2);
+CREATE INDEX IF NOT EXISTS fingerprints_band3 ON fingerprints (index_name, namespace, band3);
+CREATE TABLE IF NOT EXISTS chunk_references (
+    index_name TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    source_file_name TEXT NOT NULL,
+    chunk_count INTEGER NOT NULL,
+    PRIMARY KEY (index_name, namespace, file_name, source_file_name)
+);
+CREATE INDEX IF NOT EXISTS chunk_references_by_source ON chunk_references (index_name, namespace, source_file_name);
+"""
+
+
+def connect_catalog(config: Optional[CatalogConfig] = None) -> sqlite3.Connection:
+    config = config or CatalogConfig()
+    Path(config.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(config.db_path, timeout=config.timeout)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def document_key(text: Document) -> str:
+    return text.metadata.get("file_name") or text.metadata.get("source") or "unknown"
+
+
+def _document_digest(namespace: str, file_name: str) -> str:
+    return hashlib.sha1(f"{namespace}\0{file_name}".encode("utf-8")).hexdigest()[:16]
+
+
+def make_chunk_id(namespace: str, file_name: str, chunk_index: int) -> str:
+    """Deterministic vector ID, so re-ingesting a file overwrites its previous chunks"""
+    return f"{_document_digest(namespace, file_name)}-{chunk_index}"
+
+
+def make_document_id(namespace: str, file_name: str) -> str:
+    """Vector ID of a document's summary vector in the sidecar namespace"""
+    return f"{_document_digest(namespace, file_name)}-doc"
+
+
+def assign_chunk_ids(texts: List[Document], namespace: str) -> List[str]:
+    counters: Dict[str, int] = {}
+    ids = []
+    for text in texts:
+        file_name = document_key(text)
+        chunk_index = counters.get(file_name, 0)
+        counters[file_name] = chunk_index + 1
+        ids.append(make_chunk_id(namespace, file_name, chunk_index))
+    return ids
+
+
+def record_documents(
+        texts: List[Document],
+        chunk_ids: List[str],
+        index_name: str,
+        namespace: str,
+        embedding_model: Optional[str] = None,
+        config: Optional[CatalogConfig] = None,
+) -> Dict[str, List[str]]:
+    """Record pushed chunks per document and return chunk IDs that are no longer current"""
+    grouped: Dict[str, List[tuple[str, Document]]] = {}
+    for chunk_id, text in zip(chunk_ids, texts):
+        grouped.setdefault(document_key(text), []).append((chunk_id, text))
+
+    ingested_at = datetime.now().isoformat()
+    stale_ids: Dict[str, List[str]] = {}
+
+    with closing(connect_catalog(config)) as conn, conn:
+        for file_name, chunks in grouped.items():
+            chunk_rows = []
+            for chunk_index, (chunk_id, text) in enumerate(chunks):
+                encoded = text.page_content.encode("utf-8")
+                chunk_rows.append((
+                    index_name, namespace, chunk_id, file_name, chunk_index,
+                    hashlib.sha256(encoded).hexdigest(), len(encoded),
+                ))
+
+            new_ids = {row[2] for row in chunk_rows}
+            previous_ids = [
+                row["chunk_id"] for row in conn.execute(
+                    "SELECT chunk_id FROM chunks WHERE index_name = ? AND namespace = ? AND file_name = ?",
+                    (index_name, namespace, file_name),
+                )
+            ]
+            stale_ids[file_name] = [chunk_id for chunk_id in previous_ids if chunk_id not in new_ids]
+
+            conn.execute(
+                "DELETE FROM chunks WHERE index_name = ? AND namespace = ? AND file_name = ?",
+                (index_name, namespace, file_name),
+            )
+            conn.executemany("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?)", chunk_rows)
+
+            metadata = chunks[0][1].metadata
+            conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    index_name, namespace, file_name,
+                    metadata.get("original_file_name"), metadata.get("file_type"),
+                    hashlib.sha256("".join(row[5] for row in chunk_rows).encode("utf-8")).hexdigest(),
+                    len(chunk_rows), sum(row[6] for row in chunk_rows),
+                    embedding_model, ingested_at,
+                ),
+            )
+
+    logger.info(f"Catalog recorded {len(grouped)} documents in namespace: {namespace}")
+    return stale_ids
+
+
+def _to_signed(value: int) -> int:
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def record_fingerprints(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        fingerprints: List[tuple[int, tuple[int, int, int, int]]],
+        references: Optional[Dict[str, int]] = None,
+        config: Optional[CatalogConfig] = None,
+) -> None:
+    """Replace the stored chunk fingerprints of a document
+
+    references counts, per other document, the chunks of this document that
+    were dropped because that document already holds them.
+    """
+    with closing(connect_catalog(config)) as conn, conn:
+        for table in ("fingerprints", "chunk_references"):
+            conn.execute(
+                f"DELETE FROM {table} WHERE index_name = ? AND namespace = ? AND file_name = ?",
+                (index_name, namespace, file_name),
+            )
+        conn.executemany(
+            "INSERT INTO fingerprints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (index_name, namespace, file_name, _to_signed(fingerprint), *bands)
+                for fingerprint, bands in fingerprints
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO chunk_references VALUES (?, ?, ?, ?, ?)",
+            [
+                (index_name, namespace, file_name, source_file_name, chunk_count)
+                for source_file_name, chunk_count in (references or {}).items()
+            ],
+        )
+
+
+def find_fingerprint_candidates(
+        conn: sqlite3.Connection,
+        index_name: str,
+        namespace: str,
+        bands: tuple[int, int, int, int],
+        exclude_file_name: Optional[str] = None,
+) -> List[tuple[int, str]]:
+    """(fingerprint, file name) of stored fingerprints sharing at least one band, excluding one document"""
+    rows = conn.execute(
+        "SELECT fingerprint, file_name FROM fingerprints WHERE index_name = ? AND namespace = ? AND file_name != ? "
+        "AND (band0 = ? OR band1 = ? OR band2 = ? OR band3 = ?)",
+        (index_name, namespace, exclude_file_name or "", *bands),
+    ).fetchall()
+    return [(_to_unsigned(row["fingerprint"]), row["file_name"]) for row in rows]
+
+
+def get_dependent_documents(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        config: Optional[CatalogConfig] = None,
+) -> List[str]:
+    """Documents whose deduplicated chunks are only stored as part of file_name"""
+    with closing(connect_catalog(config)) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT file_name FROM chunk_references "
+            "WHERE index_name = ? AND namespace = ? AND source_file_name = ? AND file_name != ? ORDER BY file_name",
+            (index_name, namespace, file_name, file_name),
+        ).fetchall()
+    return [row["file_name"] for row in rows]
+
+
+def has_chunk_references(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        config: Optional[CatalogConfig] = None,
+) -> bool:
+    """True when a document was ingested with chunks deduplicated against other documents"""
+    with closing(connect_catalog(config)) as conn:
+        row = conn.execute(
+            "SELECT 1 FROM chunk_references WHERE index_name = ? AND namespace = ? AND file_name = ? LIMIT 1",
+            (index_name, namespace, file_name),
+        ).fetchone()
+    return row is not None
+
+
+def list_catalog_documents(
+        index_name: str,
+        namespace: str,
+        limit: int = 100,
+        offset: int = 0,
+        config: Optional[CatalogConfig] = None,
+) -> List[CatalogDocumentDto]:
+    with closing(connect_catalog(config)) as conn:
+        rows = conn.execute(
+            "SELECT * FROM documents WHERE index_name = ? AND namespace = ? "
+            "ORDER BY ingested_at DESC LIMIT ? OFFSET ?",
+            (index_name, namespace, limit, offset),
+        ).fetchall()
+    return [CatalogDocumentDto(**dict(row)) for row in rows]
+
+
+def get_catalog_document(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        config: Optional[CatalogConfig] = None,
+) -> Optional[CatalogDocumentDto]:
+    with closing(connect_catalog(config)) as conn:
+        row = conn.execute(
+            "SELECT * FROM documents WHERE index_name = ? AND namespace = ? AND file_name = ?",
+            (index_name, namespace, file_name),
+        ).fetchone()
+    return CatalogDocumentDto(**dict(row)) if row else None
+
+
+def get_document_chunk_ids(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        config: Optional[CatalogConfig] = None,
+) -> List[str]:
+    with closing(connect_catalog(config)) as conn:
+        rows = conn.execute(
+            "SELECT chunk_id FROM chunks WHERE index_name = ? AND namespace = ? AND file_name = ? "
+            "ORDER BY chunk_index",
+            (index_name, namespace, file_name),
+        ).fetchall()
+    return [row["chunk_id"] for row in rows]
+
+
+def get_namespace_stats(
+        index_name: str,
+        namespace: str,
+        config: Optional[CatalogConfig] = None,
+) -> NamespaceStatsDto:
+    with closing(connect_catalog(config)) as conn:
+        totals = conn.execute(
+            "SELECT COUNT(*) AS document_count, COALESCE(SUM(chunk_count), 0) AS chunk_count, "
+            "COALESCE(SUM(byte_count), 0) AS byte_count, MAX(ingested_at) AS last_ingested_at "
+            "FROM documents WHERE index_name = ? AND namespace = ?",
+            (index_name, namespace),
+        ).fetchone()
+        models = conn.execute(
+            "SELECT DISTINCT embedding_model FROM documents "
+            "WHERE index_name = ? AND namespace = ? AND embedding_model IS NOT NULL",
+            (index_name, namespace),
+        ).fetchall()
+        file_types = conn.execute(
+            "SELECT file_type, COUNT(*) AS total FROM documents "
+            "WHERE index_name = ? AND namespace = ? GROUP BY file_type",
+            (index_name, namespace),
+        ).fetchall()
+
+    return NamespaceStatsDto(
+        index_name=index_name,
+        namespace=namespace,
+        embedding_models=[row["embedding_model"] for row in models],
+        file_types={row["file_type"] or "unknown": row["total"] for row in file_types},
+        **dict(totals),
+    )
+
+
+def remove_catalog_document(
+        index_name: str,
+        namespace: str,
+        file_name: str,
+        config: Optional[CatalogConfig] = None,
+) -> None:
+    with closing(connect_catalog(config)) as conn, conn:
+        for table in ("chunks", "documents", "fingerprints", "chunk_references"):
+            conn.execute(
+                f"DELETE FROM {table} WHERE index_name = ? AND namespace = ? AND file_name = ?",
+                (index_name, namespace, file_name),
+            )
+        conn.execute(
+            "DELETE FROM chunk_references WHERE index_name = ? AND namespace = ? AND source_file_name = ?",
+            (index_name, namespace, file_name),
+        )
+
+
+def clear_catalog_namespace(
+        index_name: str,
+        namespace: str,
+        config: Optional[CatalogConfig] = None,
+) -> None:
+    with closing(connect_catalog(config)) as conn, conn:
+        for table in ("chunks", "documents", "fingerprints", "chunk_references"):
+            conn.execute(f"DELETE FROM {table} WHERE index_name = ? AND namespace = ?", (index_name, namespace))
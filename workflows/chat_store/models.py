@@ -0,0 +1,16 @@
+import os
+from dataclasses import dataclass, field
+
+from workflows.models import Message
+
+
+@dataclass
+class ChatStoreConfig:
+    db_path: str = field(default_factory=lambda: os.getenv("CHAT_STORE_DB_PATH", "data/chat_sessions.sqlite3"))
+    timeout: float = 30.0
+
+
+class StoredMessageDto(Message):
+    """A chat message as persisted in the session store."""
+    id: int
+    created_at: float
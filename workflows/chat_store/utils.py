@@ -0,0 +1,106 @@
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional
+
+from workflows.chat_store.models import ChatStoreConfig, StoredMessageDto
+from workflows.models import Message
+
+
+MESSAGE_TYPES = {"human": 0, "ai": 1}
+MESSAGE_TYPE_NAMES = {code: name for name, code in MESSAGE_TYPES.items()}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    type INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_by_session ON messages (session_id, namespace, id);
+"""
+
+
+def connect_chat_store(config: Optional[ChatStoreConfig] = None) -> sqlite3.Connection:
+    config = config or ChatStoreConfig()
+    Path(config.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(config.db_path, timeout=config.timeout)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def append_message(
+        session_id: str,
+        namespace: str,
+        message: Message,
+        config: Optional[ChatStoreConfig] = None,
+) -> int:
+    """Append one message to a session and return its ID"""
+    if message.type not in MESSAGE_TYPES:
+        raise ValueError(f"Unsupported message type: {message.type}. Supported types: {', '.join(MESSAGE_TYPES)}")
+
+    with closing(connect_chat_store(config)) as conn, conn:
+        cursor = conn.execute(
+            "INSERT INTO messages (session_id, namespace, type, content, created_at) VALUES (?, ?, ?, ?, ?)",
+            (session_id, namespace, MESSAGE_TYPES[message.type], message.content, time.time()),
+        )
+        return cursor.lastrowid
+
+
+def load_recent_messages(
+        session_id: str,
+        namespace: str,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        config: Optional[ChatStoreConfig] = None,
+) -> List[StoredMessageDto]:
+    """Load up to `limit` messages older than `before_id`, oldest first"""
+    query = "SELECT id, type, content, created_at FROM messages WHERE session_id = ? AND namespace = ?"
+    params: list = [session_id, namespace]
+    if before_id is not None:
+        query += " AND id < ?"
+        params.append(before_id)
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(limit)
+
+    with closing(connect_chat_store(config)) as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    return [
+        StoredMessageDto(
+            id=row["id"],
+            type=MESSAGE_TYPE_NAMES[row["type"]],
+            content=row["content"],
+            created_at=row["created_at"],
+        )
+        for row in reversed(rows)
+    ]
+
+
+def has_earlier_messages(
+        session_id: str,
+        namespace: str,
+        before_id: int,
+        config: Optional[ChatStoreConfig] = None,
+) -> bool:
+    with closing(connect_chat_store(config)) as conn:
+        row = conn.execute(
+            "SELECT 1 FROM messages WHERE session_id = ? AND namespace = ? AND id < ? LIMIT 1",
+            (session_id, namespace, before_id),
+        ).fetchone()
+    return row is not None
+
+
+def clear_session(
+        session_id: str,
+        namespace: str,
+        config: Optional[ChatStoreConfig] = None,
+) -> None:
+    with closing(connect_chat_store(config)) as conn, conn:
+        conn.execute("DELETE FROM messages WHERE session_id = ? AND namespace = ?", (session_id, namespace))
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import re
+from contextlib import closing, nullcontext
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+from langchain_core.documents import Document
+
+from workflows.catalog.utils import connect_catalog, document_key, find_fingerprint_candidates, record_fingerprints
+from workflows.loader import FileLoader
+
+
+FINGERPRINT_BITS = 64
+BAND_BITS = 16
+
+Bands = Tuple[int, int, int, int]
+Fingerprints = Dict[str, List[Tuple[int, Bands]]]
+References = Dict[str, Dict[str, int]]
+
+
+@dataclass
+class DedupConfig:
+    """Opt-in near-duplicate chunk elimination between splitting and pushing.
+
+    ``document`` scope only compares chunks of the file being ingested,
+    ``namespace`` also compares them with every file already in the namespace.
+    """
+    enabled: bool = field(default_factory=lambda: os.getenv("DEDUP_CHUNKS", "0") == "1")
+    scope: str = field(default_factory=lambda: os.getenv("DEDUP_SCOPE", "document"))
+    max_hamming_distance: int = field(default_factory=lambda: int(os.getenv("DEDUP_MAX_HAMMING", "3")))
+    shingle_size: int = 3
+
+
+class DedupReportDto(BaseModel):
+    """What the dedup stage removed from one ingest."""
+    chunks_in: int = 0
+    chunks_kept: int = 0
+    duplicates_in_document: int = 0
+    duplicates_in_namespace: int = 0
+    vectors_saved: int = 0
+    bytes_saved: int = 0
+    referenced_documents: List[str] = []
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """64-bit SimHash over word shingles of whitespace- and case-normalised text"""
+    words = re.findall(r"\w+", text.lower())
+    shingles = [
+        " ".join(words[start:start + shingle_size])
+        for start in range(max(1, len(words) - shingle_size + 1))
+    ]
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def fingerprint_bands(fingerprint: int) -> Bands:
+    """Split a fingerprint into four 16-bit bands; fingerprints within 3 bits share at least one"""
+    mask = (1 << BAND_BITS) - 1
+    return tuple(fingerprint >> (band * BAND_BITS) & mask for band in range(4))
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return bin(left ^ right).count("1")
+
+
+def deduplicate_chunks(
+        texts: List[Document],
+        index_name: str,
+        namespace: str,
+        config: Optional[DedupConfig] = None,
+) -> Tuple[List[Document], DedupReportDto, Fingerprints, References]:
+    """Drop chunks that are near-duplicates of an earlier chunk
+
+    Repeats within a document are folded into the first copy, which records
+    how many copies it absorbed in its ``duplicates`` metadata. With namespace
+    scope, chunks that already exist in other files of the namespace are
+    dropped too. Returns the kept chunks, a report, the fingerprints of the
+    kept chunks per file and, per file, the other files its dropped chunks
+    matched; both are persisted once the push succeeds.
+
+    Row groups of spreadsheets are always kept: their repeated header and
+    column values dominate the shingles, so distinct rows look alike.
+    """
+    config = config or DedupConfig()
+    report = DedupReportDto(chunks_in=len(texts))
+    if not config.enabled:
+        report.chunks_kept = len(texts)
+        return texts, report, {}, {}
+
+    kept: List[Document] = []
+    kept_fingerprints: Fingerprints = {}
+    references: References = {}
+    band_index: Dict[Tuple[str, int, int], List[Tuple[int, Document]]] = {}
+
+    conn = connect_catalog() if config.scope == "namespace" else None
+    with closing(conn) if conn else nullcontext():
+        for text in texts:
+            if text.metadata.get("file_type") in FileLoader.PRECHUNKED_TYPES:
+                kept.append(text)
+                continue
+
+            file_name = document_key(text)
+            fingerprint = simhash(text.page_content, config.shingle_size)
+            bands = fingerprint_bands(fingerprint)
+
+            original = next(
+                (
+                    candidate
+                    for band, value in enumerate(bands)
+                    for candidate_fingerprint, candidate in band_index.get((file_name, band, value), [])
+                    if hamming_distance(fingerprint, candidate_fingerprint) <= config.max_hamming_distance
+                ),
+                None,
+            )
+            if original is not None:
+                original.metadata["duplicates"] = original.metadata.get("duplicates", 0) + 1
+                report.duplicates_in_document += 1
+                report.bytes_saved += len(text.page_content.encode("utf-8"))
+                continue
+
+            source_file_name = conn is not None and next(
+                (
+                    stored_file_name
+                    for stored, stored_file_name in find_fingerprint_candidates(
+                        conn, index_name, namespace, bands, file_name
+                    )
+                    if hamming_distance(fingerprint, stored) <= config.max_hamming_distance
+                ),
+                None,
+            )
+            if source_file_name:
+                file_references = references.setdefault(file_name, {})
+                file_references[source_file_name] = file_references.get(source_file_name, 0) + 1
+                report.duplicates_in_namespace += 1
+                report.bytes_saved += len(text.page_content.encode("utf-8"))
+                continue
+
+            for band, value in enumerate(bands):
+                band_index.setdefault((file_name, band, value), []).append((fingerprint, text))
+            kept_fingerprints.setdefault(file_name, []).append((fingerprint, bands))
+            kept.append(text)
+
+    report.chunks_kept = len(kept)
+    report.vectors_saved = report.duplicates_in_document + report.duplicates_in_namespace
+    report.referenced_documents = sorted({name for sources in references.values() for name in sources})
+    if report.vectors_saved:
+        logger.info(
+            f"Dedup dropped {report.vectors_saved} of {report.chunks_in} chunks "
+            f"({report.bytes_saved} bytes) in namespace: {namespace}"
+        )
+    return kept, report, kept_fingerprints, references
+
+
+def save_fingerprints(
+        fingerprints: Fingerprints,
+        references: References,
+        index_name: str,
+        namespace: str,
+) -> None:
+    """Persist fingerprints of pushed chunks and the documents dropped chunks depend on
+
+    Fingerprints serve namespace-wide dedup of later ingests; references keep
+    a document that holds another document's content from being deleted.
+    """
+    try:
+        for file_name in fingerprints.keys() | references.keys():
+            record_fingerprints(
+                index_name,
+                namespace,
+                file_name,
+                fingerprints.get(file_name, []),
+                references.get(file_name),
+            )
+    except Exception as e:
+        logger.error(f"Failed to save chunk fingerprints: {e}")
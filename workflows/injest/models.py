@@ -0,0 +1,17 @@
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def _optional_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+@dataclass
+class IngestConfig:
+    """Where ingestion runs its CPU-bound parsing and how long each stage may take."""
+    executor: str = field(default_factory=lambda: os.getenv("INGEST_EXECUTOR", "thread"))
+    max_workers: int = field(default_factory=lambda: int(os.getenv("INGEST_WORKERS", "2")))
+    parse_timeout: Optional[float] = field(default_factory=lambda: _optional_float("INGEST_PARSE_TIMEOUT"))
+    push_timeout: Optional[float] = field(default_factory=lambda: _optional_float("INGEST_PUSH_TIMEOUT"))
@@ -1,9 +1,11 @@
 from typing import Dict, Any
 from workflows.injest.utils import load_file_push_to_db
 from workflows.models import InjestRequestDto
+from workflows.workload.recorder import record_workload, describe_ingest
 from loguru import logger
 
 
+@record_workload("ingest", describe_ingest)
 async def injest_doc(
         request: InjestRequestDto
 ) -> Dict[str, Any]:
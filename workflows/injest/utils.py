@@ -1,51 +1,152 @@
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from workflows.models import InjestRequestDto
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 
 from loguru import logger
 from workflows.loader import file_loader
-from workflows.vector_db.utils import push_to_database
+from workflows.catalog.utils import document_key
+from workflows.vector_db.utils import apush_to_database, remove_documents
 from workflows.vector_db.models import PineconeConfig
+from workflows.injest.models import IngestConfig
+from workflows.dedup import DedupConfig, deduplicate_chunks, save_fingerprints
+
+
+_executor: Optional[Executor] = None
+
+# Parses that outlived INGEST_PARSE_TIMEOUT; they cannot be interrupted and keep their worker busy
+_timed_out_parses: Set[Future] = set()
+
+
+def get_ingest_executor(config: IngestConfig) -> Executor:
+    """Shared pool for parsing and splitting, created on first ingest"""
+    global _executor
+    if _executor is None:
+        if config.executor == "process":
+            _executor = ProcessPoolExecutor(max_workers=config.max_workers)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=config.max_workers, thread_name_prefix="ingest")
+        logger.info(f"Started {config.executor} pool with {config.max_workers} workers for ingestion")
+    return _executor
+
+
+def submit_parse(config: IngestConfig, func, *args: Any, **kwargs: Any) -> Future:
+    """Submit a parse to the ingest pool, refusing when every worker is held by a timed-out parse"""
+    if len(_timed_out_parses) >= config.max_workers:
+        raise RuntimeError(
+            f"All {config.max_workers} ingest workers are busy with parses that timed out, try again later"
+        )
+    return get_ingest_executor(config).submit(func, *args, **kwargs)
+
+
+def abandon_parse(future: Future) -> None:
+    """Track a timed-out parse until its worker frees up"""
+    if future.cancel():
+        return
+    _timed_out_parses.add(future)
+    future.add_done_callback(_timed_out_parses.discard)
 
 
 async def load_file_push_to_db(
         request: InjestRequestDto
 ) -> Dict[str, Any]:
     try:
-        logger.debug(f"load_file_push_to_db(): Attempting to load file from {request.pre_signed_url}")
+        logger.debug(f"load_file_push_to_db(): Attempting to load file from {request.source_label}")
+
+        ingest_config = IngestConfig()
+        source = request.source
+        if ingest_config.executor == "process" and isinstance(source, memoryview):
+            # memoryviews cannot be pickled across process boundaries
+            source = bytes(source)
 
-        chunked_documents = file_loader(
-            file_path=request.pre_signed_url,
-            file_name=request.file_name,
-            original_file_name=request.original_file_name,
-            file_type=request.file_type,
+        parse = submit_parse(
+            ingest_config,
+            partial(
+                file_loader,
+                file_path=source,
+                file_name=request.file_name,
+                original_file_name=request.original_file_name,
+                file_type=request.file_type,
+            ),
         )
-        logger.info(f"Successfully loaded file from {request.pre_signed_url} and total chunks: {len(chunked_documents)}")
+        try:
+            chunked_documents = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(parse)),
+                timeout=ingest_config.parse_timeout,
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            abandon_parse(parse)
+            raise
+        logger.info(f"Successfully loaded file from {request.source_label} and total chunks: {len(chunked_documents)}")
 
         config = PineconeConfig()
-        push_status = push_to_database(
+        file_names = sorted({document_key(text) for text in chunked_documents})
+        chunked_documents, dedup_report, fingerprints, references = await asyncio.to_thread(
+            deduplicate_chunks,
+            chunked_documents,
+            config.index_name,
+            request.namespace,
+            DedupConfig(),
+        )
+
+        if not chunked_documents:
+            logger.info("All chunks were duplicates of existing content, nothing to push")
+            # The earlier version of the file would otherwise stay cataloged and searchable
+            await asyncio.to_thread(remove_documents, file_names, config.index_name, request.namespace)
+            await asyncio.to_thread(save_fingerprints, fingerprints, references, config.index_name, request.namespace)
+            return {
+                "success": True,
+                "message": "File contains no new content",
+                "file_name": request.file_name,
+                "namespace": request.namespace,
+                "chunks": 0,
+                "dedup": dedup_report.model_dump()
+            }
+
+        push_result = await apush_to_database(
             texts=chunked_documents,
             index_name=config.index_name,
-            namespace=request.namespace
+            namespace=request.namespace,
+            timeout=ingest_config.push_timeout,
         )
 
-        if not push_status:
+        if not push_result.status:
             return {
                 "success": False,
                 "message": "Failed to push documents to database",
                 "file_name": request.file_name
             }
 
+        await asyncio.to_thread(save_fingerprints, fingerprints, references, config.index_name, request.namespace)
+
         logger.info("Processing completed successfully")
         return {
             "success": True,
-            "message": "File processed and stored successfully",
+            "message": (
+                "File processed and stored successfully" if push_result.catalog_updated
+                else "File stored, but the document catalog could not be updated"
+            ),
             "file_name": request.file_name,
             "namespace": request.namespace,
-            "chunks": len(chunked_documents)
+            "chunks": len(chunked_documents),
+            "catalog": push_result.catalog_updated,
+            "dedup": dedup_report.model_dump()
+        }
+
+    except asyncio.TimeoutError:
+        logger.error(
+            f"Timed out parsing file from {request.source_label}; "
+            f"the parse keeps its worker until it finishes ({len(_timed_out_parses)} workers held)"
+        )
+        return {
+            "success": False,
+            "message": "Timed out parsing file",
+            "file_name": request.file_name
         }
 
     except Exception as e:
-        logger.error(f"Failed to load file from {request.pre_signed_url} and error is {e}")
+        logger.error(f"Failed to load file from {request.source_label} and error is {e}")
         return {
             "success": False,
             "message": f"Error processing file: {str(e)}",
@@ -1,27 +1,70 @@
-import requests
+import csv
+import inspect
+import io
+import shutil
+import zipfile
+from contextlib import contextmanager
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
 from os import remove
 from os.path import expanduser, isfile
 from pathlib import Path
 from loguru import logger
 from urllib.parse import urlparse
 from tempfile import NamedTemporaryFile
-from typing import Any, List, Optional, Dict, Union
+from typing import Any, BinaryIO, Iterator, List, Optional, Dict, Sequence, Type, Union
+from xml.etree import ElementTree
 
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
-from langchain_community.document_loaders import (
-    TextLoader,
-    PyMuPDFLoader,
-    UnstructuredCSVLoader,
-    UnstructuredWordDocumentLoader,
-    UnstructuredExcelLoader
-)
 
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+LOADER_ENTRY_POINT_GROUP = "launched_ed.loaders"
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+LoaderSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+
+def is_in_memory_source(source: Any) -> bool:
+    """True for bytes-like objects and readable file-like objects"""
+    return isinstance(source, (bytes, bytearray, memoryview)) or hasattr(source, "read")
+
+
+def describe_source(source: LoaderSource, source_name: Optional[str] = None) -> str:
+    """Human readable name for a source, used in metadata and log messages
+
+    In-memory sources have no path, so the caller's file name is used when given.
+    """
+    if is_in_memory_source(source):
+        name = source_name or getattr(source, "name", None)
+        return name if isinstance(name, str) else "<memory>"
+    return str(source)
+
+
+@contextmanager
+def open_binary(source: LoaderSource) -> Iterator[BinaryIO]:
+    """Open a path or in-memory source as a binary stream
+
+    Caller-owned streams are rewound but left open. Bytes-like sources are
+    wrapped in a BytesIO, which shares an immutable ``bytes`` buffer but
+    copies a memoryview or bytearray once.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)
+    elif hasattr(source, "read"):
+        if source.seekable():
+            source.seek(0)
+        yield source
+    else:
+        with open(source, "rb") as handle:
+            yield handle
 
 
 def split_text(text: list[Document], chunk_size: int, chunk_overlap: int) -> list[Document]:
     """Split documents into chunks"""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap
@@ -29,43 +72,275 @@ def split_text(text: list[Document], chunk_size: int, chunk_overlap: int) -> lis
     return text_splitter.split_documents(text)
 
 
+class PlainTextLoader(BaseLoader):
+    """Reads a text file into a single document"""
+    SUPPORTS_STREAM = True
+
+    def __init__(self, file_path: LoaderSource, encoding: str = "utf-8", source_name: Optional[str] = None):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.source = describe_source(file_path, source_name)
+
+    def lazy_load(self) -> Iterator[Document]:
+        if isinstance(self.file_path, (bytes, bytearray, memoryview)):
+            text = str(self.file_path, self.encoding, "replace")
+        else:
+            with open_binary(self.file_path) as handle:
+                text = handle.read().decode(self.encoding, errors="replace")
+        yield Document(page_content=text, metadata={"source": self.source})
+
+
+class PdfLoader(BaseLoader):
+    """Loads one document per PDF page with PyMuPDF, from a path or a memory buffer"""
+    SUPPORTS_STREAM = True
+
+    def __init__(self, file_path: LoaderSource, source_name: Optional[str] = None):
+        self.file_path = file_path
+        self.source = describe_source(file_path, source_name)
+
+    def _open(self):
+        import pymupdf
+
+        if isinstance(self.file_path, (bytes, bytearray, memoryview)):
+            return pymupdf.open(stream=self.file_path, filetype="pdf")
+        if hasattr(self.file_path, "getbuffer"):
+            return pymupdf.open(stream=self.file_path.getbuffer(), filetype="pdf")
+        if hasattr(self.file_path, "read"):
+            with open_binary(self.file_path) as handle:
+                return pymupdf.open(stream=handle.read(), filetype="pdf")
+        return pymupdf.open(str(self.file_path))
+
+    def lazy_load(self) -> Iterator[Document]:
+        with self._open() as pdf:
+            pdf_metadata = {
+                k: v for k, v in (pdf.metadata or {}).items()
+                if isinstance(v, (str, int)) and v != ""
+            }
+            for page in pdf:
+                yield Document(
+                    page_content=page.get_text(),
+                    metadata={
+                        "source": self.source,
+                        "file_path": self.source,
+                        "page": page.number,
+                        "total_pages": pdf.page_count,
+                        **pdf_metadata,
+                    },
+                )
+
+
+class DocxLoader(BaseLoader):
+    """Extracts paragraph text from a docx archive without `unstructured`"""
+    SUPPORTS_STREAM = True
+
+    def __init__(self, file_path: LoaderSource, source_name: Optional[str] = None):
+        self.file_path = file_path
+        self.source = describe_source(file_path, source_name)
+
+    @staticmethod
+    def _paragraph_text(paragraph: ElementTree.Element) -> str:
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{WORD_NAMESPACE}t" and node.text:
+                parts.append(node.text)
+            elif node.tag == f"{WORD_NAMESPACE}tab":
+                parts.append("\t")
+            elif node.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                parts.append("\n")
+        return "".join(parts)
+
+    def lazy_load(self) -> Iterator[Document]:
+        paragraphs = []
+        with open_binary(self.file_path) as stream, zipfile.ZipFile(stream) as archive:
+            with archive.open("word/document.xml") as handle:
+                for _, element in ElementTree.iterparse(handle):
+                    if element.tag == f"{WORD_NAMESPACE}p":
+                        text = self._paragraph_text(element)
+                        if text.strip():
+                            paragraphs.append(text)
+                        element.clear()
+
+        yield Document(page_content="\n\n".join(paragraphs), metadata={"source": self.source})
+
+
+class SpreadsheetLoader(BaseLoader):
+    """Streams xlsx/csv rows into row-group documents with the header repeated"""
+    SUPPORTS_STREAM = True
+
+    def __init__(
+            self,
+            file_path: LoaderSource,
+            file_type: Optional[str] = None,
+            rows_per_chunk: int = 50,
+            max_chunk_chars: int = 4000,
+            delimiter: str = ",",
+            encoding: str = "utf-8-sig",
+            source_name: Optional[str] = None,
+    ):
+        self.file_path = file_path
+        self.source = describe_source(file_path, source_name)
+        self.file_type = (file_type or Path(self.source).suffix.lstrip(".")).lower()
+        self.rows_per_chunk = rows_per_chunk
+        self.max_chunk_chars = max_chunk_chars
+        self.delimiter = delimiter
+        self.encoding = encoding
+
+    @staticmethod
+    def _format_row(row: Sequence[Any]) -> str:
+        return " | ".join("" if cell is None else str(cell).strip() for cell in row)
+
+    def _iter_sheets(self) -> Iterator[tuple[str, Iterator[Sequence[Any]]]]:
+        """Yield (sheet name, row iterator) pairs without materialising the file"""
+        with open_binary(self.file_path) as stream:
+            if self.file_type == "csv":
+                handle = io.TextIOWrapper(stream, encoding=self.encoding, newline="")
+                try:
+                    yield Path(self.source).stem, csv.reader(handle, delimiter=self.delimiter)
+                finally:
+                    handle.detach()
+                return
+
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+            try:
+                for worksheet in workbook.worksheets:
+                    yield worksheet.title, worksheet.iter_rows(values_only=True)
+            finally:
+                workbook.close()
+
+    def _make_document(self, sheet: str, header: str, rows: List[str], row_start: int, row_end: int) -> Document:
+        return Document(
+            page_content="\n".join([header, *rows]),
+            metadata={
+                "source": self.source,
+                "sheet": sheet,
+                "row_start": row_start,
+                "row_end": row_end,
+            },
+        )
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Yield one document per group of rows, each prefixed with the sheet header
+
+        A row too long to fit max_chunk_chars next to the header is split into
+        several documents, so no chunk exceeds the limit.
+        """
+        for sheet, rows in self._iter_sheets():
+            header = None
+            group: List[str] = []
+            group_chars = 0
+            row_start = 0
+            split_rows = 0
+
+            for row_number, row in enumerate(rows, start=1):
+                line = self._format_row(row)
+                if not line.replace("|", "").strip():
+                    continue
+
+                if header is None:
+                    header = line
+                    row_budget = max(self.max_chunk_chars - len(header) - 1, self.max_chunk_chars // 2)
+                    continue
+
+                if len(line) > row_budget:
+                    # A single oversized row (e.g. a free-text column) is split into pieces under the header
+                    if group:
+                        yield self._make_document(sheet, header, group, row_start, last_row)
+                        group, group_chars = [], 0
+                    split_rows += 1
+                    for offset in range(0, len(line), row_budget):
+                        yield self._make_document(
+                            sheet, header, [line[offset:offset + row_budget]], row_number, row_number
+                        )
+                    continue
+
+                if group and (
+                        len(group) >= self.rows_per_chunk
+                        or group_chars + len(line) > self.max_chunk_chars
+                ):
+                    yield self._make_document(sheet, header, group, row_start, row_number - 1)
+                    group, group_chars = [], 0
+
+                if not group:
+                    row_start = row_number
+                group.append(line)
+                group_chars += len(line) + 1
+                last_row = row_number
+
+            if group:
+                yield self._make_document(sheet, header, group, row_start, last_row)
+            elif header is not None and not split_rows:
+                yield self._make_document(sheet, header, [], 1, 1)
+
+
 class UnifiedLoader:
-    """Handles loading files from both local paths and URLs"""
+    """Handles loading files from local paths, URLs and in-memory sources
+
+    Bytes-like and file-like sources, including downloaded URLs, are handed to
+    loaders that declare ``SUPPORTS_STREAM`` without touching disk. Other
+    loaders get the content spilled to a temporary file.
+    """
     def __init__(
             self,
             base_loader_cls,
-            file_path: Union[str, Path],
+            file_path: LoaderSource,
             headers: Optional[Dict[str, Any]] = None,
+            source_name: Optional[str] = None,
             **unstructured_kwargs: Any,
     ):
         self._temp_file = None
         self.headers = headers or {}
+        self.supports_stream = getattr(base_loader_cls, "SUPPORTS_STREAM", False)
         self.file_path = self._setup_file_path(file_path)
+        if source_name and is_in_memory_source(self.file_path) and self._accepts_source_name(base_loader_cls):
+            unstructured_kwargs["source_name"] = source_name
         self.loader = base_loader_cls(
-            file_path=str(self.file_path),
+            file_path=self.file_path if is_in_memory_source(self.file_path) else str(self.file_path),
             **unstructured_kwargs
         )
 
+    @staticmethod
+    def _accepts_source_name(loader_cls) -> bool:
+        """Only loaders that take a source_name get the original file name of in-memory content"""
+        try:
+            return "source_name" in inspect.signature(loader_cls).parameters
+        except (TypeError, ValueError):
+            return False
+
     @staticmethod
     def _is_valid_url(url: str) -> bool:
         parsed = urlparse(url)
         return bool(parsed.scheme) and bool(parsed.netloc)
 
-    def _setup_file_path(self, file_path: Union[str, Path]) -> Path:
-        """Set up file path from URL or local path"""
+    def _spill_to_temp_file(self, source: LoaderSource) -> Path:
+        """Write an in-memory source to disk for loaders that only accept paths"""
+        self._temp_file = NamedTemporaryFile(delete=False)
+        try:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                self._temp_file.write(source)
+            else:
+                with open_binary(source) as stream:
+                    shutil.copyfileobj(stream, self._temp_file)
+            self._temp_file.flush()
+            return Path(self._temp_file.name)
+        except Exception:
+            self._temp_file.close()
+            remove(self._temp_file.name)
+            self._temp_file = None
+            raise
+
+    def _setup_file_path(self, file_path: LoaderSource) -> LoaderSource:
+        """Set up the loader source from a URL, in-memory content or local path"""
         if isinstance(file_path, str) and self._is_valid_url(file_path):
-            self._temp_file = NamedTemporaryFile(delete=False)
-            try:
-                resp = requests.get(file_path, headers=self.headers)
-                resp.raise_for_status()
-                self._temp_file.write(resp.content)
-                self._temp_file.flush()
-                return Path(self._temp_file.name)
-            except Exception:
-                if self._temp_file:
-                    self._temp_file.close()
-                    remove(self._temp_file.name)
-                raise
+            import requests
+
+            resp = requests.get(file_path, headers=self.headers)
+            resp.raise_for_status()
+            file_path = resp.content
+
+        if is_in_memory_source(file_path):
+            return file_path if self.supports_stream else self._spill_to_temp_file(file_path)
 
         path = Path(file_path)
         if "~" in str(path):
@@ -79,7 +354,7 @@ class UnifiedLoader:
         """Load documents from file"""
         documents = self.loader.load()
         if not documents:
-            raise ValueError(f"No documents loaded from {self.file_path}")
+            raise ValueError(f"No documents loaded from {describe_source(self.file_path)}")
         return documents
 
     def __del__(self) -> None:
@@ -89,33 +364,129 @@ class UnifiedLoader:
             remove(self._temp_file.name)
 
 
+class LoaderRegistry:
+    """Resolves loader classes per file type on first use
+
+    Targets are either classes or ``"module:attribute"`` strings, so heavy
+    loader dependencies are only imported once a file of that type is loaded.
+    Packages can add or override loaders through the ``launched_ed.loaders``
+    entry point group, keyed by file type.
+    """
+    def __init__(self, loaders: Dict[str, Union[str, Type[BaseLoader]]], entry_point_group: Optional[str] = None):
+        self._targets: Dict[str, Union[str, EntryPoint, Type[BaseLoader]]] = dict(loaders)
+        self._resolved: Dict[str, Type[BaseLoader]] = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points_loaded = entry_point_group is None
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        try:
+            for entry_point in entry_points(group=self._entry_point_group):
+                file_type = entry_point.name.lower()
+                if file_type not in self._resolved:
+                    self._targets[file_type] = entry_point
+                logger.debug(f"Registered loader entry point for {file_type}: {entry_point.value}")
+        except Exception as e:
+            logger.error(f"Failed to read loader entry points: {e}")
+
+    def register(self, file_type: str, loader: Union[str, Type[BaseLoader]]) -> None:
+        """Register or replace the loader used for a file type"""
+        self._load_entry_points()
+        file_type = file_type.lower()
+        self._targets[file_type] = loader
+        self._resolved.pop(file_type, None)
+
+    def file_types(self) -> List[str]:
+        self._load_entry_points()
+        return list(self._targets.keys())
+
+    def __contains__(self, file_type: str) -> bool:
+        return file_type.lower() in self.file_types()
+
+    def get(self, file_type: str) -> Type[BaseLoader]:
+        """Return the loader class for a file type, importing it on first use"""
+        file_type = file_type.lower()
+        if file_type in self._resolved:
+            return self._resolved[file_type]
+
+        self._load_entry_points()
+        if file_type not in self._targets:
+            raise ValueError(f"Unsupported file type: {file_type}. Supported types: {', '.join(self._targets.keys())}")
+
+        target = self._targets[file_type]
+        if isinstance(target, EntryPoint):
+            loader_cls = target.load()
+        elif isinstance(target, str):
+            module_name, _, attribute = target.partition(":")
+            loader_cls = getattr(import_module(module_name), attribute)
+        else:
+            loader_cls = target
+
+        self._resolved[file_type] = loader_cls
+        return loader_cls
+
+
+loader_registry = LoaderRegistry(
+    {
+        "txt": PlainTextLoader,
+        "pdf": PdfLoader,
+        "docx": DocxLoader,
+        "xlsx": SpreadsheetLoader,
+        "csv": SpreadsheetLoader,
+    },
+    entry_point_group=LOADER_ENTRY_POINT_GROUP,
+)
+
+
+def register_loader(file_type: str, loader: Union[str, Type[BaseLoader]]) -> None:
+    """Register a loader class (or ``"module:attribute"`` path) for a file type"""
+    loader_registry.register(file_type, loader)
+
+
 class FileLoader(BaseLoader):
     """Maps file types to appropriate loaders"""
-    LOADER_MAP = {
-        "txt": TextLoader,
-        "pdf": PyMuPDFLoader,
-        "docx": UnstructuredWordDocumentLoader,
-        "xlsx": UnstructuredExcelLoader,
-        "csv": UnstructuredCSVLoader
+
+    LOADER_KWARGS = {
+        "xlsx": {"file_type": "xlsx"},
+        "csv": {"file_type": "csv"},
     }
 
-    def __init__(self, file_path: Union[str, Path], file_type: str = "txt", headers: Optional[Dict[str, Any]] = None):
+    # Loaders that already emit retrieval-sized chunks and must not be re-split
+    PRECHUNKED_TYPES = {"xlsx", "csv"}
+
+    def __init__(
+            self,
+            file_path: LoaderSource,
+            file_type: str = "txt",
+            headers: Optional[Dict[str, Any]] = None,
+            source_name: Optional[str] = None,
+    ):
         self.file_path = str(file_path) if hasattr(file_path, '__fspath__') else file_path
         self.file_type = file_type.lower()
         self.headers = headers or {}
+        self.source_name = source_name
 
-        if self.file_type not in self.LOADER_MAP:
-            raise ValueError(f"Unsupported file type: {self.file_type}. Supported types: {', '.join(self.LOADER_MAP.keys())}")
+        if self.file_type not in loader_registry:
+            raise ValueError(f"Unsupported file type: {self.file_type}. Supported types: {', '.join(loader_registry.file_types())}")
 
     def load(self) -> List[Document]:
         """Load documents using appropriate loader"""
-        loader_cls = self.LOADER_MAP.get(self.file_type)
-        loader = UnifiedLoader(loader_cls, file_path=self.file_path, headers=self.headers)
+        loader_cls = loader_registry.get(self.file_type)
+        loader = UnifiedLoader(
+            loader_cls,
+            file_path=self.file_path,
+            headers=self.headers,
+            source_name=self.source_name,
+            **self.LOADER_KWARGS.get(self.file_type, {})
+        )
         return loader.load()
 
 
 def file_loader(
-        file_path: str,
+        file_path: LoaderSource,
         file_name: str,
         original_file_name: str,
         file_type: str,
@@ -123,22 +494,23 @@ def file_loader(
 ) -> List[Document]:
     """Load, split and enrich documents with metadata"""
 
-    FILE_TYPE = [
-        'pdf','docx','txt','xlsx'
-    ]
+    FILE_TYPE = loader_registry.file_types()
     if file_type not in FILE_TYPE:
         raise ValueError(f"Unsupported file type: {file_type}. Supported types: {', '.join(FILE_TYPE)}")
 
     # Load documents
-    loader = FileLoader(file_path=file_path, file_type=file_type)
+    loader = FileLoader(file_path=file_path, file_type=file_type, source_name=original_file_name)
     loaded_documents = loader.load()
 
     # Split into chunks
-    parsed_documents = split_text(
-        text=loaded_documents,
-        chunk_size=1000,
-        chunk_overlap=200,
-    )
+    if file_type in FileLoader.PRECHUNKED_TYPES:
+        parsed_documents = loaded_documents
+    else:
+        parsed_documents = split_text(
+            text=loaded_documents,
+            chunk_size=1000,
+            chunk_overlap=200,
+        )
 
     # Prepare metadata
     additional_metadata = {
@@ -147,6 +519,9 @@ def file_loader(
         "file_type": file_type,
     }
 
+    if is_in_memory_source(file_path):
+        additional_metadata["source"] = original_file_name
+
     if metadata:
         for meta_dict in metadata:
             additional_metadata.update(meta_dict)
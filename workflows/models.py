@@ -1,14 +1,32 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class InjestRequestDto(BaseModel):
-    pre_signed_url: str
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    pre_signed_url: Optional[str] = None
+    content: Optional[Union[bytes, memoryview]] = Field(default=None, exclude=True, repr=False)
     file_name: str
     original_file_name: str
     file_type: str
     namespace: Optional[str] = "dev"
 
+    @model_validator(mode="after")
+    def check_source(self) -> "InjestRequestDto":
+        if self.pre_signed_url is None and self.content is None:
+            raise ValueError("Either pre_signed_url or content must be provided")
+        return self
+
+    @property
+    def source(self) -> Union[str, bytes, memoryview]:
+        """In-memory content when provided, otherwise the pre-signed URL or path"""
+        return self.content if self.content is not None else self.pre_signed_url
+
+    @property
+    def source_label(self) -> str:
+        return self.pre_signed_url or f"<memory:{self.file_name}>"
+
 
 class Message(BaseModel):
     type: str
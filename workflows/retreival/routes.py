@@ -4,34 +4,70 @@ from langchain.chains.llm import LLMChain
 from loguru import logger
 from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 
-from workflows.vector_db.utils import get_related_docs_with_score
+from workflows.vector_db.utils import (
+    get_related_docs_with_score,
+    get_related_docs_from_sources,
+    get_related_docs_hierarchical,
+)
 from workflows.retreival.prompt import get_response_generation_prompt
 from workflows.utils import get_chat_model
-from workflows.vector_db.models import PineconeConfig
+from workflows.vector_db.models import PineconeConfig, RetrievalSource, DocumentIndexConfig
 from workflows.models import Message
+from workflows.workload.recorder import record_workload, describe_chat
+from workflows.scheduler import get_scheduler, estimate_tokens, Priority
 
 
+@record_workload("chat", describe_chat)
 async def get_response(
         question: str,
         language: str,
         chat_context: Optional[List[Message]] = None,
         namespace: Optional[str] = None,
         index_name: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        sources: Optional[List[RetrievalSource]] = None,
+        hierarchical: Optional[bool] = None,
 ) -> Dict[str, Any]:
     try:
         if question is None:
             raise ValueError("Question cannot be None")
 
         config = PineconeConfig()
-        if index_name is None:
+        if index_name is not None:
             config.index_name = index_name
 
-        docs = await get_related_docs_with_score(
-            question=question,
-            index_name=config.index_name,
-            namespace=namespace or config.namespace,
-            total_docs_to_retrieve=10,
-        )
+        if hierarchical is None:
+            hierarchical = DocumentIndexConfig().hierarchical_retrieval
+
+        scheduler = get_scheduler()
+        tenant = namespace or (sources[0].namespace if sources else config.namespace)
+
+        async with scheduler.slot(tenant, Priority.INTERACTIVE, tokens=estimate_tokens(question)):
+            if sources:
+                docs = await get_related_docs_from_sources(
+                    sources=sources,
+                    question=question,
+                    total_docs_to_retrieve=top_k,
+                    filters=filters,
+                    index_name=config.index_name,
+                )
+            elif hierarchical:
+                docs = await get_related_docs_hierarchical(
+                    question=question,
+                    index_name=config.index_name,
+                    namespace=namespace or config.namespace,
+                    total_docs_to_retrieve=top_k,
+                    filters=filters,
+                )
+            else:
+                docs = await get_related_docs_with_score(
+                    question=question,
+                    index_name=config.index_name,
+                    namespace=namespace or config.namespace,
+                    total_docs_to_retrieve=top_k,
+                    filters=filters,
+                )
 
         if not docs:
             return {
@@ -42,13 +78,15 @@ async def get_response(
 
         chain = get_response_generation_prompt() | get_chat_model() | StrOutputParser()
 
-        response = await chain.ainvoke(
-            {
-                "context": docs,
-                "chat_history": chat_context or [],
-                "question": question
-            }
-        )
+        prompt_tokens = estimate_tokens(question, *[doc.page_content for doc, _ in docs])
+        async with scheduler.slot(tenant, Priority.INTERACTIVE, tokens=prompt_tokens):
+            response = await chain.ainvoke(
+                {
+                    "context": docs,
+                    "chat_history": chat_context or [],
+                    "question": question
+                }
+            )
 
         logger.debug(f"RAW LLM RESPONSE {response}")
 
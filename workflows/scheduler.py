@@ -0,0 +1,325 @@
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BULK = 1
+
+
+def _optional_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+@dataclass
+class TenantQuota:
+    """Per-namespace share of provider capacity; None means unlimited."""
+    weight: float = 1.0
+    chunks_per_minute: Optional[float] = field(default_factory=lambda: _optional_float("TENANT_CHUNKS_PER_MINUTE"))
+    tokens_per_minute: Optional[float] = field(default_factory=lambda: _optional_float("TENANT_TOKENS_PER_MINUTE"))
+
+
+class TokenBucket:
+    """Refills continuously up to one minute's worth of budget"""
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be consumed; oversized requests wait for a full bucket"""
+        self._refill()
+        needed = min(amount, self.capacity)
+        return 0.0 if self.level >= needed else (needed - self.level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+
+@dataclass
+class _Tenant:
+    quota: TenantQuota
+    chunk_bucket: Optional[TokenBucket]
+    token_bucket: Optional[TokenBucket]
+    last_finish: Dict[Priority, float] = field(default_factory=dict)
+
+    def wait_time(self, chunks: int, tokens: int) -> float:
+        return max(
+            self.chunk_bucket.wait_time(chunks) if self.chunk_bucket and chunks else 0.0,
+            self.token_bucket.wait_time(tokens) if self.token_bucket and tokens else 0.0,
+        )
+
+    def consume(self, chunks: int, tokens: int) -> None:
+        if self.chunk_bucket and chunks:
+            self.chunk_bucket.consume(chunks)
+        if self.token_bucket and tokens:
+            self.token_bucket.consume(tokens)
+
+
+@dataclass(order=True)
+class _Request:
+    finish_tag: float
+    sequence: int
+    start_tag: float = field(compare=False)
+    namespace: str = field(compare=False)
+    priority: Priority = field(compare=False)
+    chunks: int = field(compare=False)
+    tokens: int = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    loop: asyncio.AbstractEventLoop = field(compare=False)
+    granted: bool = field(default=False, compare=False)
+    abandoned: bool = field(default=False, compare=False)
+
+
+class FairScheduler:
+    """Weighted fair queueing of provider calls across namespaces
+
+    Interactive work is always dispatched before bulk work. Within a priority
+    class, namespaces share capacity in proportion to their weight using
+    start-time fair queueing, and each namespace is held to its chunk and
+    token per-minute quotas.
+
+    One scheduler is shared by every thread and event loop in the process.
+    Its state is guarded by a lock, and each waiter is woken on its own loop
+    with call_soon_threadsafe, so the concurrency limit holds across
+    Streamlit sessions that each run their own loop.
+    """
+    def __init__(
+            self,
+            max_concurrency: int = 4,
+            default_quota: Optional[TenantQuota] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.default_quota = default_quota or TenantQuota()
+        self._quotas: Dict[str, TenantQuota] = {}
+        self._tenants: Dict[str, _Tenant] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+        self._queues: Dict[Priority, List[_Request]] = {priority: [] for priority in Priority}
+        self._virtual_time: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._in_flight = 0
+        self._wakeup: Optional[threading.Timer] = None
+        self._stats: Dict[Tuple[str, Priority], Dict[str, float]] = {}
+
+    def configure_tenant(self, namespace: str, quota: TenantQuota) -> None:
+        with self._lock:
+            self._quotas[namespace] = quota
+            self._tenants.pop(namespace, None)
+
+    def _tenant(self, namespace: str) -> _Tenant:
+        if namespace not in self._tenants:
+            quota = self._quotas.get(namespace, self.default_quota)
+            self._tenants[namespace] = _Tenant(
+                quota=quota,
+                chunk_bucket=TokenBucket(quota.chunks_per_minute) if quota.chunks_per_minute else None,
+                token_bucket=TokenBucket(quota.tokens_per_minute) if quota.tokens_per_minute else None,
+            )
+        return self._tenants[namespace]
+
+    def _enqueue(self, namespace: str, priority: Priority, chunks: int, tokens: int) -> _Request:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tenant = self._tenant(namespace)
+            cost = max(1, tokens or chunks or 1)
+            start_tag = max(self._virtual_time[priority], tenant.last_finish.get(priority, 0.0))
+            finish_tag = start_tag + cost / max(tenant.quota.weight, 1e-6)
+            tenant.last_finish[priority] = finish_tag
+
+            request = _Request(
+                finish_tag=finish_tag,
+                sequence=next(self._sequence),
+                start_tag=start_tag,
+                namespace=namespace,
+                priority=priority,
+                chunks=chunks,
+                tokens=tokens,
+                enqueued_at=time.monotonic(),
+                future=loop.create_future(),
+                loop=loop,
+            )
+            heapq.heappush(self._queues[priority], request)
+        return request
+
+    def _grant_ready(self) -> List[_Request]:
+        """Mark the requests that may run now; must be called with the lock held"""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        granted = []
+        retry_in = None
+        for priority in Priority:
+            queue = self._queues[priority]
+            throttled = []
+            while queue and self._in_flight < self.max_concurrency:
+                request = heapq.heappop(queue)
+                if request.abandoned:
+                    continue
+
+                tenant = self._tenant(request.namespace)
+                wait = tenant.wait_time(request.chunks, request.tokens)
+                if wait > 0:
+                    throttled.append(request)
+                    retry_in = wait if retry_in is None else min(retry_in, wait)
+                    continue
+
+                tenant.consume(request.chunks, request.tokens)
+                self._virtual_time[priority] = max(self._virtual_time[priority], request.start_tag)
+                self._in_flight += 1
+                request.granted = True
+                self._record_wait(request)
+                granted.append(request)
+
+            for request in throttled:
+                heapq.heappush(queue, request)
+
+        if retry_in is not None:
+            self._wakeup = threading.Timer(retry_in, self._dispatch)
+            self._wakeup.daemon = True
+            self._wakeup.start()
+        return granted
+
+    @staticmethod
+    def _wake(request: _Request) -> None:
+        """Runs on the waiter's own loop; a cancelled waiter releases its slot itself"""
+        if not request.future.done():
+            request.future.set_result(None)
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._lock:
+                granted = self._grant_ready()
+            if not granted:
+                return
+
+            lost = 0
+            for request in granted:
+                try:
+                    request.loop.call_soon_threadsafe(self._wake, request)
+                except RuntimeError:
+                    # The waiter's loop has closed, so nobody will use or release this slot
+                    lost += 1
+
+            if not lost:
+                return
+            with self._lock:
+                self._in_flight = max(0, self._in_flight - lost)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+        self._dispatch()
+
+    def _record_wait(self, request: _Request) -> None:
+        waited = time.monotonic() - request.enqueued_at
+        stats = self._stats.setdefault(
+            (request.namespace, request.priority),
+            {"dispatched": 0, "total_wait_s": 0.0, "max_wait_s": 0.0, "chunks": 0, "tokens": 0},
+        )
+        stats["dispatched"] += 1
+        stats["total_wait_s"] += waited
+        stats["max_wait_s"] = max(stats["max_wait_s"], waited)
+        stats["chunks"] += request.chunks
+        stats["tokens"] += request.tokens
+        if waited > 1.0:
+            logger.debug(f"{request.priority.name.lower()} work for {request.namespace} waited {waited:.2f}s")
+
+    @asynccontextmanager
+    async def slot(
+            self,
+            namespace: str,
+            priority: Priority = Priority.INTERACTIVE,
+            chunks: int = 0,
+            tokens: int = 0,
+    ) -> AsyncIterator[None]:
+        """Hold one unit of provider concurrency for the body of the block"""
+        request = self._enqueue(namespace or "default", priority, chunks, tokens)
+        self._dispatch()
+        try:
+            await request.future
+        except BaseException:
+            with self._lock:
+                request.abandoned = True
+                granted = request.granted
+            if granted:
+                self._release()
+            raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def run(
+            self,
+            namespace: str,
+            priority: Priority,
+            func: Callable[..., Awaitable[Any]],
+            *args: Any,
+            chunks: int = 0,
+            tokens: int = 0,
+            **kwargs: Any,
+    ) -> Any:
+        async with self.slot(namespace, priority, chunks=chunks, tokens=tokens):
+            return await func(*args, **kwargs)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current queue depths and cumulative wait times per namespace and priority"""
+        with self._lock:
+            depth: Dict[str, Dict[str, int]] = {}
+            for priority, queue in self._queues.items():
+                for request in queue:
+                    if not request.abandoned:
+                        per_namespace = depth.setdefault(request.namespace, {})
+                        per_namespace[priority.name.lower()] = per_namespace.get(priority.name.lower(), 0) + 1
+
+            waits: Dict[str, Dict[str, Any]] = {}
+            for (namespace, priority), stats in self._stats.items():
+                waits.setdefault(namespace, {})[priority.name.lower()] = {
+                    **stats,
+                    "mean_wait_s": stats["total_wait_s"] / stats["dispatched"] if stats["dispatched"] else 0.0,
+                }
+            in_flight = self._in_flight
+
+        return {
+            "in_flight": in_flight,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": depth,
+            "wait_time": waits,
+        }
+
+
+_scheduler: Optional[FairScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> FairScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FairScheduler(max_concurrency=int(os.getenv("SCHEDULER_MAX_CONCURRENCY", "4")))
+    return _scheduler
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count (about four characters per token) for quota accounting"""
+    return max(1, sum(len(text) for text in texts) // 4)
@@ -49,6 +49,11 @@ def get_embedding_model():
         raise e
 
 
+def get_embedding_model_name(embedding_model=None) -> str:
+    embedding_model = embedding_model or get_embedding_model()
+    return getattr(embedding_model, "model", None) or type(embedding_model).__name__
+
+
 try:
     vectors = get_embedding_model().embed_query(
         "This is a test to check if the embedding model is working correctly."
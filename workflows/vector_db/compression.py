@@ -0,0 +1,235 @@
+import asyncio
+import os
+import re
+import threading
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from langchain_core.embeddings import Embeddings
+
+from workflows.vector_db.models import CompressionConfig
+
+
+_projections: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+_projection_lock = threading.Lock()
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def projection_path(namespace: str, config: CompressionConfig) -> Path:
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", namespace or "default")
+    return Path(config.projection_dir) / f"{safe_name}-{config.target_dimension}.npz"
+
+
+def _fit_pca(vectors: np.ndarray, target_dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    mean = vectors.mean(axis=0)
+    _, _, components = np.linalg.svd(vectors - mean, full_matrices=False)
+    return mean, components[:target_dimension].T.astype(np.float32)
+
+
+def _truncation_projection(dimension: int, target_dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """A projection that keeps the leading dimensions, stored like a fitted one"""
+    return np.zeros(dimension, dtype=np.float32), np.eye(dimension, target_dimension, dtype=np.float32)
+
+
+def _save_projection(
+        path: Path,
+        mean: np.ndarray,
+        projection: np.ndarray,
+        overwrite: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Atomically publish a projection file and return the one now on disk
+
+    Without overwrite the first writer wins, also across processes, and later
+    writers adopt its projection so every vector of a namespace shares one space.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=path.parent, suffix=".npz", delete=False) as handle:
+        np.savez(handle, mean=mean, projection=projection)
+
+    try:
+        if overwrite:
+            os.replace(handle.name, path)
+        else:
+            try:
+                os.link(handle.name, path)
+            except FileExistsError:
+                logger.info(f"Projection {path.name} was published concurrently, using the existing one")
+    finally:
+        if os.path.exists(handle.name):
+            os.remove(handle.name)
+
+    _projections.pop(str(path), None)
+    return load_projection_from(path)
+
+
+def fit_projection(embeddings: List[List[float]], namespace: str, config: CompressionConfig) -> None:
+    """Fit and persist a PCA projection for a namespace from sample embeddings
+
+    Replaces any existing projection, so vectors already stored in the
+    namespace must be re-ingested afterwards.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if len(vectors) < config.target_dimension:
+        raise ValueError(
+            f"PCA to {config.target_dimension} dimensions needs at least {config.target_dimension} "
+            f"sample embeddings, got {len(vectors)}"
+        )
+
+    with _projection_lock:
+        _save_projection(projection_path(namespace, config), *_fit_pca(vectors, config.target_dimension), overwrite=True)
+    logger.info(f"Fitted PCA projection {vectors.shape[1]} -> {config.target_dimension} for namespace: {namespace}")
+
+
+def ensure_projection(vectors: np.ndarray, namespace: str, config: CompressionConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """Projection of a namespace, created from its first pushed embeddings if missing
+
+    A first push with fewer chunks than the target dimension cannot fit PCA;
+    the namespace is then pinned to truncation instead.
+    """
+    with _projection_lock:
+        existing = load_projection(namespace, config)
+        if existing is not None:
+            return existing
+
+        if len(vectors) >= config.target_dimension:
+            mean, projection = _fit_pca(vectors, config.target_dimension)
+            logger.info(f"Fitted PCA projection {vectors.shape[1]} -> {config.target_dimension} for namespace: {namespace}")
+        else:
+            mean, projection = _truncation_projection(vectors.shape[1], config.target_dimension)
+            logger.warning(
+                f"First push to namespace {namespace} has {len(vectors)} chunks, too few to fit PCA to "
+                f"{config.target_dimension} dimensions; using truncation. Fit a projection ahead of time "
+                f"with `python -m workflows.vector_db.recall <files> --method pca --fit-namespace {namespace}`"
+            )
+        return _save_projection(projection_path(namespace, config), mean, projection, overwrite=False)
+
+
+def load_projection_from(path: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    if str(path) not in _projections:
+        if not path.exists():
+            return None
+        with np.load(path) as stored:
+            _projections[str(path)] = (stored["mean"], stored["projection"])
+    return _projections[str(path)]
+
+
+def load_projection(namespace: str, config: CompressionConfig) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    return load_projection_from(projection_path(namespace, config))
+
+
+def needs_projection_fit(namespace: str, config: CompressionConfig) -> bool:
+    return config.enabled and config.method == "pca" and load_projection(namespace, config) is None
+
+
+def compress_vectors(
+        embeddings: List[List[float]],
+        namespace: str,
+        config: Optional[CompressionConfig] = None,
+        fit: bool = False,
+) -> List[List[float]]:
+    """Reduce embeddings to the configured dimension and re-normalise them for cosine search
+
+    With fit, a namespace without a PCA projection gets one created from these
+    embeddings; only the push path may do that. Queries against a namespace
+    without a projection, which therefore holds no vectors yet, are truncated.
+    """
+    config = config or CompressionConfig()
+    if not config.enabled or not embeddings:
+        return embeddings
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if config.method == "truncate":
+        reduced = vectors[:, :config.target_dimension]
+    elif config.method == "pca":
+        stored = load_projection(namespace, config)
+        if stored is None:
+            stored = (
+                ensure_projection(vectors, namespace, config) if fit
+                else _truncation_projection(vectors.shape[1], config.target_dimension)
+            )
+        mean, projection = stored
+        reduced = (vectors - mean) @ projection
+    else:
+        raise ValueError(f"Unsupported compression method: {config.method}")
+
+    return _normalise(reduced).tolist()
+
+
+class CompressedEmbeddings(Embeddings):
+    """Wraps an embedding model so stored and query vectors share one compressed space"""
+    def __init__(self, base: Embeddings, namespace: str, config: Optional[CompressionConfig] = None):
+        self.base = base
+        self.namespace = namespace
+        self.config = config or CompressionConfig()
+
+    @property
+    def model(self) -> Optional[str]:
+        return getattr(self.base, "model", None)
+
+    def compress(self, embeddings: List[List[float]], fit: bool = False) -> List[List[float]]:
+        return compress_vectors(embeddings, self.namespace, self.config, fit=fit)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.compress(self.base.embed_documents(texts), fit=True)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.compress([self.base.embed_query(text)])[0]
+
+    # Compression may load or fit a projection, so the async variants run it in a thread
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.compress, await self.base.aembed_documents(texts), True)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await asyncio.to_thread(self.compress, [await self.base.aembed_query(text)]))[0]
+
+
+def quantize_vectors(vectors: np.ndarray, quantization: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Quantize to float16, or to int8 with one symmetric scale per vector"""
+    if quantization == "float16":
+        return vectors.astype(np.float16), None
+    if quantization == "int8":
+        scales = np.abs(vectors).max(axis=1, keepdims=True) / 127.0
+        scales = np.where(scales == 0, 1.0, scales)
+        return np.round(vectors / scales).astype(np.int8), scales.astype(np.float32)
+    return vectors.astype(np.float32), None
+
+
+def dequantize_vectors(vectors: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+    vectors = vectors.astype(np.float32)
+    return vectors * scales if scales is not None else vectors
+
+
+def measure_recall_at_k(
+        corpus: np.ndarray,
+        queries: np.ndarray,
+        compress: Callable[[np.ndarray], np.ndarray],
+        k: int = 10,
+        quantization: str = "none",
+        exclude_self: bool = False,
+) -> float:
+    """Mean overlap between exact cosine top-k and top-k in the compressed space
+
+    With exclude_self the queries are rows of the corpus and their own row is
+    ignored in both rankings.
+    """
+    def top_k(matrix: np.ndarray, query_matrix: np.ndarray) -> np.ndarray:
+        scores = _normalise(query_matrix) @ _normalise(matrix).T
+        if exclude_self:
+            np.fill_diagonal(scores, -np.inf)
+        return np.argsort(-scores, axis=1)[:, :k]
+
+    baseline = top_k(corpus, queries)
+
+    compressed_corpus, scales = quantize_vectors(compress(corpus), quantization)
+    compressed = top_k(dequantize_vectors(compressed_corpus, scales), compress(queries))
+
+    overlaps = [len(set(expected) & set(found)) / k for expected, found in zip(baseline, compressed)]
+    return float(np.mean(overlaps))
@@ -0,0 +1,62 @@
+from typing import Any, Dict, Optional
+
+
+FILTERABLE_FIELDS = {
+    "file_name",
+    "original_file_name",
+    "file_type",
+    "title",
+    "page",
+    "sheet",
+}
+
+FILTER_OPERATORS = {"eq", "ne", "gt", "gte", "lt", "lte", "in", "nin"}
+
+
+def _translate_condition(field: str, condition: Any) -> Dict[str, Any]:
+    if isinstance(condition, dict):
+        translated = {}
+        for operator, value in condition.items():
+            operator = operator.lstrip("$")
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Unsupported filter operator {operator!r} for {field}. "
+                    f"Supported operators: {', '.join(sorted(FILTER_OPERATORS))}"
+                )
+            if operator in ("in", "nin"):
+                if not isinstance(value, (list, tuple, set, frozenset)):
+                    raise ValueError(
+                        f"Filter operator {operator!r} for {field} takes a list of values, "
+                        f"got {type(value).__name__}"
+                    )
+                value = list(value)
+            translated[f"${operator}"] = value
+        return translated
+
+    if isinstance(condition, (list, tuple, set)):
+        return {"$in": list(condition)}
+
+    return {"$eq": condition}
+
+
+def build_metadata_filter(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Translate structured filters into a vector store filter expression
+
+    Scalars match exactly, lists match any of their values and dicts map
+    operators (``eq``, ``gte``, ``in`` ...) to values, e.g.
+    ``{"file_name": "report.pdf", "page": {"gte": 2, "lte": 5}}``. Fields are
+    combined with AND and must be metadata attached by ``file_loader``.
+    """
+    if not filters:
+        return None
+
+    expression = {}
+    for field, condition in filters.items():
+        if field not in FILTERABLE_FIELDS:
+            raise ValueError(
+                f"Unsupported filter field {field!r}. "
+                f"Supported fields: {', '.join(sorted(FILTERABLE_FIELDS))}"
+            )
+        expression[field] = _translate_condition(field, condition)
+
+    return expression
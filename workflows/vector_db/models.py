@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 
-from typing import Optional, List
+from typing import Optional, List, Literal
 from workflows.utils import VECTOR_LEN
 
 
@@ -13,13 +14,63 @@ class PushToDatabaseResponseDto(BaseModel):
     timestamp: Optional[str] = None
     index: Optional[str] = None
     namespace: Optional[str] = None
+    catalog_updated: bool = False
+
+
+class RetrievalSource(BaseModel):
+    """One (index, namespace) pair queried by multi-source retrieval."""
+    namespace: str
+    index_name: Optional[str] = None
+    weight: float = 1.0
+    normalization: Literal["none", "minmax"] = "none"
+    timeout: float = Field(default=5.0, gt=0)
+
+
+def _optional_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+@dataclass
+class CompressionConfig:
+    """Optional reduction of embedding dimensionality before vectors are stored.
+
+    ``truncate`` keeps the leading dimensions (only meaningful for Matryoshka
+    models such as text-embedding-3-*), ``pca`` projects onto components fitted
+    per namespace.
+    """
+    method: Literal["none", "truncate", "pca"] = field(default_factory=lambda: os.getenv("VECTOR_COMPRESSION", "none"))
+    target_dimension: Optional[int] = field(default_factory=lambda: _optional_int("VECTOR_TARGET_DIMENSION"))
+    projection_dir: str = field(default_factory=lambda: os.getenv("VECTOR_PROJECTION_DIR", "data/projections"))
+
+    @property
+    def enabled(self) -> bool:
+        return self.method != "none" and bool(self.target_dimension)
+
+    def output_dimension(self, dimension: Optional[int]) -> Optional[int]:
+        return self.target_dimension if self.enabled else dimension
+
+
+@dataclass
+class DocumentIndexConfig:
+    """Document-level summary vectors used to pre-select files before chunk search.
+
+    Summary vectors live in a sidecar namespace next to the chunk namespace.
+    """
+    enabled: bool = field(default_factory=lambda: os.getenv("DOCUMENT_VECTORS", "1") != "0")
+    hierarchical_retrieval: bool = field(default_factory=lambda: os.getenv("HIERARCHICAL_RETRIEVAL", "0") == "1")
+    top_documents: int = field(default_factory=lambda: int(os.getenv("HIERARCHICAL_TOP_DOCUMENTS", "5")))
+    namespace_suffix: str = "__documents"
+
+    def namespace_for(self, namespace: str) -> str:
+        return f"{namespace}{self.namespace_suffix}"
 
 
 @dataclass
 class PineconeConfig:
     index_name: str = "test"
     namespace: str = "default"
-    dimension: int = VECTOR_LEN
+    dimension: int = field(default_factory=lambda: CompressionConfig().output_dimension(VECTOR_LEN))
     metric: str = "cosine"
     cloud: str = "aws"
     region: str = "us-east-1"
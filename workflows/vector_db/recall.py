@@ -0,0 +1,98 @@
+"""Measure recall@k of compressed embeddings against the uncompressed baseline.
+
+Usage:
+    python -m workflows.vector_db.recall docs/handbook.pdf docs/policies.docx --method pca --dimension 384
+    python -m workflows.vector_db.recall docs/*.pdf --method truncate --dimension 512 --quantization int8 \
+        --questions questions.txt --k 10
+    python -m workflows.vector_db.recall docs/*.pdf --method pca --dimension 256 --fit-namespace team_space
+"""
+import argparse
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from workflows.loader import file_loader
+from workflows.utils import get_embedding_model
+from workflows.vector_db.compression import compress_vectors, fit_projection, measure_recall_at_k
+from workflows.vector_db.models import CompressionConfig
+
+
+def load_chunks(paths: List[str]) -> List[str]:
+    chunks = []
+    for path in paths:
+        name = Path(path).name
+        documents = file_loader(
+            file_path=path,
+            file_name=name,
+            original_file_name=name,
+            file_type=Path(path).suffix.lstrip(".").lower(),
+        )
+        chunks.extend(document.page_content for document in documents)
+    return chunks
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Compare compressed and full embeddings on recall@k")
+    parser.add_argument("files", nargs="+", help="Documents to build the evaluation corpus from")
+    parser.add_argument("--method", choices=["truncate", "pca"], required=True)
+    parser.add_argument("--dimension", type=int, required=True, help="Target dimension")
+    parser.add_argument("--quantization", choices=["none", "float16", "int8"], default="none")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--questions", help="Text file with one question per line; defaults to sampled chunks")
+    parser.add_argument("--sample", type=int, default=200, help="Number of chunks used as queries without --questions")
+    parser.add_argument("--fit-namespace", help="Also fit and save the PCA projection for this namespace")
+    args = parser.parse_args(argv)
+
+    config = CompressionConfig(method=args.method, target_dimension=args.dimension)
+    if not args.fit_namespace:
+        config.projection_dir = tempfile.mkdtemp(prefix="recall-")
+    embedding_model = get_embedding_model()
+
+    chunks = load_chunks(args.files)
+    random.Random(0).shuffle(chunks)
+    logger.info(f"Embedding {len(chunks)} chunks from {len(args.files)} files")
+    corpus = np.asarray(embedding_model.embed_documents(chunks), dtype=np.float32)
+
+    if args.questions:
+        questions = [line.strip() for line in Path(args.questions).read_text().splitlines() if line.strip()]
+        queries = np.asarray(embedding_model.embed_documents(questions), dtype=np.float32)
+        exclude_self = False
+    else:
+        queries = corpus[:args.sample]
+        exclude_self = True
+
+    namespace = args.fit_namespace or "__recall_eval__"
+    if args.method == "pca":
+        fit_projection(corpus.tolist(), namespace, config)
+
+    def compress(vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(compress_vectors(vectors.tolist(), namespace, config), dtype=np.float32)
+
+    recall = measure_recall_at_k(
+        corpus, queries, compress, k=args.k, quantization=args.quantization, exclude_self=exclude_self
+    )
+
+    bytes_per_value = {"none": 4, "float16": 2, "int8": 1}[args.quantization]
+    report = {
+        "method": args.method,
+        "quantization": args.quantization,
+        "corpus_size": len(corpus),
+        "queries": len(queries),
+        "k": args.k,
+        "full_dimension": int(corpus.shape[1]),
+        "compressed_dimension": args.dimension,
+        "bytes_per_vector": args.dimension * bytes_per_value,
+        "compression_ratio": corpus.shape[1] * 4 / (args.dimension * bytes_per_value),
+        f"recall@{args.k}": recall,
+    }
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
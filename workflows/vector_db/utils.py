@@ -1,79 +1,472 @@
-from typing import List, Union, Optional
+import asyncio
+import heapq
+import math
+import numpy as np
+from typing import Any, Dict, List, Union, Optional
 
 from datetime import datetime
 from loguru import logger
 
-from workflows.utils import get_embedding_model
+from workflows.utils import get_embedding_model, get_embedding_model_name
+from workflows.catalog.utils import (
+    assign_chunk_ids,
+    record_documents,
+    clear_catalog_namespace,
+    document_key,
+    make_document_id,
+    get_catalog_document,
+    get_document_chunk_ids,
+    remove_catalog_document,
+)
 from workflows.vector_db.client import initialize_pinecone
-from workflows.vector_db.models import PineconeConfig, PushToDatabaseResponseDto
+from workflows.vector_db.models import (
+    PineconeConfig,
+    PushToDatabaseResponseDto,
+    RetrievalSource,
+    CompressionConfig,
+    DocumentIndexConfig,
+)
+from workflows.vector_db.compression import (
+    CompressedEmbeddings,
+    compress_vectors,
+    ensure_projection,
+    needs_projection_fit,
+)
+from workflows.vector_db.filters import build_metadata_filter
 
 from langchain_core.documents import Document
 from langchain_pinecone import PineconeVectorStore
 from pinecone import Pinecone, ServerlessSpec, PineconeApiException
 
 from workflows.handler import retry_with_custom_backoff
+from workflows.scheduler import get_scheduler, estimate_tokens, Priority
+
+
+def get_index_embedding_model(namespace: Optional[str]):
+    """Embedding model whose vectors match what is stored in the namespace"""
+    compression = CompressionConfig()
+    if compression.enabled:
+        return CompressedEmbeddings(get_embedding_model(), namespace, compression)
+    return get_embedding_model()
+
+
+def get_index_embedding_model_name() -> str:
+    compression = CompressionConfig()
+    name = get_embedding_model_name()
+    return f"{name}/{compression.method}-{compression.target_dimension}" if compression.enabled else name
+
+
+def drop_pinecone_namespace(config: PineconeConfig) -> None:
+    pinecone_vs = initialize_pinecone()
+    loaded_index = pinecone_vs.Index(config.index_name)
+
+    if loaded_index is None:
+        raise ValueError(f"Index {config.index_name} not found")
+
+    namespaces = list(loaded_index.describe_index_stats()["namespaces"].keys())
+
+    for namespace in (config.namespace, DocumentIndexConfig().namespace_for(config.namespace)):
+        if namespace in namespaces:
+            loaded_index.delete(delete_all=True, namespace=namespace)
+            logger.info(f"Deleted namespace: {namespace} from index: {config.index_name}")
+
+    clear_catalog_namespace(config.index_name, config.namespace)
+
+
+def build_vectors(
+        texts: List[Document],
+        embeddings: List[List[float]],
+        meta_datas: List[dict],
+        ids: List[str],
+        text_key: str = "text",
+) -> List[dict]:
+    """Pinecone upsert payloads; the chunk text is stored under text_key for retrieval"""
+    return [
+        {"id": chunk_id, "values": embedding, "metadata": {**meta_data, text_key: text.page_content}}
+        for chunk_id, text, embedding, meta_data in zip(ids, texts, embeddings, meta_datas)
+    ]
+
+
+def build_document_vectors(
+        texts: List[Document],
+        embeddings: List[List[float]],
+        namespace: str,
+        text_key: str = "text",
+) -> List[dict]:
+    """One summary vector per file: the normalised centroid of its chunk embeddings"""
+    grouped: Dict[str, List[int]] = {}
+    for position, text in enumerate(texts):
+        grouped.setdefault(document_key(text), []).append(position)
+
+    vectors = []
+    for file_name, positions in grouped.items():
+        centroid = np.asarray([embeddings[position] for position in positions], dtype=np.float32).mean(axis=0)
+        norm = np.linalg.norm(centroid)
+        metadata = texts[positions[0]].metadata
+        vectors.append({
+            "id": make_document_id(namespace, file_name),
+            "values": (centroid / norm if norm else centroid).tolist(),
+            "metadata": {
+                **{
+                    key: metadata[key]
+                    for key in ("file_name", "original_file_name", "file_type", "title")
+                    if metadata.get(key) is not None
+                },
+                "file_name": file_name,
+                "chunk_count": len(positions),
+                text_key: metadata.get("title") or file_name,
+            },
+        })
+    return vectors
+
+
+def upsert_vectors(
+        vectors: List[dict],
+        index_name: str,
+        namespace: str,
+        batch_size: int = 100,
+) -> None:
+    loaded_index = initialize_pinecone().Index(index_name)
+    for start in range(0, len(vectors), batch_size):
+        loaded_index.upsert(vectors=vectors[start:start + batch_size], namespace=namespace)
 
 
 def handle_pinecone_push(
         texts: List,
         meta_datas: List,
         config: PineconeConfig,
-        drop_namespace: bool=False
+        drop_namespace: bool=False,
+        ids: Optional[List[str]] = None,
 ) -> PushToDatabaseResponseDto:
     if drop_namespace:
-        pinecone_vs = initialize_pinecone()
-        loaded_index = pinecone_vs.Index(config.index_name)
-
-        if loaded_index is None:
-            raise (f"Index {config.index_name} not found")
-
-        namespaces = list(loaded_index.describe_index_stats()["namespaces"].keys())
+        drop_pinecone_namespace(config)
 
-        if config.namespace in namespaces:
-            loaded_index.delete(delete_all=True, namespace=config.namespace)
-            logger.info(f"Deleted namespace: {config.namespace} from index: {config.index_name}")
-
-    PineconeVectorStore.from_texts(
-        [t.page_content for t in texts],
-        get_embedding_model(),
-        meta_datas,
+    ids = ids or assign_chunk_ids(texts, config.namespace)
+    embeddings = get_index_embedding_model(config.namespace).embed_documents([t.page_content for t in texts])
+    upsert_vectors(
+        build_vectors(texts, embeddings, meta_datas, ids),
         index_name=config.index_name,
         namespace=config.namespace,
     )
 
+    document_index = DocumentIndexConfig()
+    if document_index.enabled:
+        upsert_vectors(
+            build_document_vectors(texts, embeddings, config.namespace),
+            index_name=config.index_name,
+            namespace=document_index.namespace_for(config.namespace),
+        )
+
+    return PushToDatabaseResponseDto(
+        status=True,
+        message="Documents pushed successfully",
+        document_ids=ids,
+        timestamp=datetime.now().isoformat(),
+        index=config.index_name,
+        namespace=config.namespace
+    )
+
+
+async def ahandle_pinecone_push(
+        texts: List,
+        meta_datas: List,
+        config: PineconeConfig,
+        drop_namespace: bool=False,
+        ids: Optional[List[str]] = None,
+        batch_size: int = 100,
+) -> PushToDatabaseResponseDto:
+    """Async variant of handle_pinecone_push that never blocks the event loop
+
+    Embeddings use the model's async client; the Pinecone client is
+    synchronous, so namespace drops and upserts run in worker threads.
+    Each batch is scheduled as bulk work for the namespace, so interactive
+    queries can overtake a large ingest.
+
+    The first push to a namespace using PCA compression fits its projection
+    on the leading batches, enough of them to cover the target dimension,
+    before any batch is compressed.
+
+    If a batch fails or the push is cancelled, the remaining batches are
+    cancelled and upserts already running in threads are awaited, so nothing
+    is written to the index after this coroutine has finished.
+    """
+    if drop_namespace:
+        await asyncio.to_thread(drop_pinecone_namespace, config)
+
+    ids = ids or assign_chunk_ids(texts, config.namespace)
+    embedding_model = get_index_embedding_model(config.namespace)
+    scheduler = get_scheduler()
+
+    all_embeddings: List[Optional[List[float]]] = [None] * len(texts)
+    upserts: List[asyncio.Future] = []
+
+    async def upsert(vectors: List[dict], namespace: str) -> None:
+        # Threads cannot be cancelled; keep the future so a failed push can wait for it
+        future = asyncio.ensure_future(
+            asyncio.to_thread(upsert_vectors, vectors, index_name=config.index_name, namespace=namespace)
+        )
+        upserts.append(future)
+        await asyncio.shield(future)
+
+    async def embed_batch(start: int, embed) -> List[List[float]]:
+        contents = [t.page_content for t in texts[start:start + batch_size]]
+        return await scheduler.run(
+            config.namespace,
+            Priority.BULK,
+            embed,
+            contents,
+            chunks=len(contents),
+            tokens=estimate_tokens(*contents),
+        )
+
+    async def push_batch(start: int, raw_embeddings: Optional[List[List[float]]] = None) -> None:
+        batch = texts[start:start + batch_size]
+        if raw_embeddings is None:
+            embeddings = await embed_batch(start, embedding_model.aembed_documents)
+        else:
+            embeddings = await asyncio.to_thread(embedding_model.compress, raw_embeddings)
+        all_embeddings[start:start + len(batch)] = embeddings
+        async with scheduler.slot(config.namespace, Priority.BULK):
+            await upsert(
+                build_vectors(batch, embeddings, meta_datas[start:start + batch_size], ids[start:start + batch_size]),
+                config.namespace,
+            )
+
+    starts = list(range(0, len(texts), batch_size))
+    sample: Dict[int, List[List[float]]] = {}
+    if needs_projection_fit(config.namespace, CompressionConfig()):
+        # Fit on uncompressed embeddings of the leading batches, then compress them like the rest
+        sample_starts = starts[:math.ceil(embedding_model.config.target_dimension / batch_size)]
+        raw = await asyncio.gather(*[embed_batch(start, embedding_model.base.aembed_documents) for start in sample_starts])
+        sample = dict(zip(sample_starts, raw))
+        await asyncio.to_thread(
+            ensure_projection,
+            np.asarray([vector for batch in raw for vector in batch], dtype=np.float32),
+            config.namespace,
+            embedding_model.config,
+        )
+
+    batches = [asyncio.ensure_future(push_batch(start, sample.get(start))) for start in starts]
+    try:
+        await asyncio.gather(*batches)
+
+        document_index = DocumentIndexConfig()
+        if document_index.enabled:
+            async with scheduler.slot(config.namespace, Priority.BULK):
+                await upsert(
+                    build_document_vectors(texts, all_embeddings, config.namespace),
+                    document_index.namespace_for(config.namespace),
+                )
+    except BaseException:
+        for batch in batches:
+            batch.cancel()
+        await asyncio.gather(*batches, *upserts, return_exceptions=True)
+        raise
+
     return PushToDatabaseResponseDto(
         status=True,
         message="Documents pushed successfully",
-        document_ids=None,
+        document_ids=ids,
         timestamp=datetime.now().isoformat(),
         index=config.index_name,
         namespace=config.namespace
     )
 
 
+def discard_uncataloged_vectors(
+        texts: List,
+        chunk_ids: List[str],
+        index_name: str,
+        namespace: str,
+) -> None:
+    """Delete vectors of a failed push that the catalog does not know about
+
+    IDs the catalog already lists for these files (from an earlier ingest)
+    stay, since per-document delete and stale cleanup can still reach them.
+    """
+    try:
+        file_names = {document_key(text) for text in texts}
+        cataloged_ids = set()
+        cataloged_files = set()
+        for file_name in file_names:
+            if get_catalog_document(index_name, namespace, file_name) is not None:
+                cataloged_files.add(file_name)
+                cataloged_ids.update(get_document_chunk_ids(index_name, namespace, file_name))
+
+        delete_vectors(
+            ids=[chunk_id for chunk_id in chunk_ids if chunk_id not in cataloged_ids],
+            index_name=index_name,
+            namespace=namespace,
+        )
+        document_index = DocumentIndexConfig()
+        if document_index.enabled:
+            delete_vectors(
+                ids=[make_document_id(namespace, file_name) for file_name in file_names - cataloged_files],
+                index_name=index_name,
+                namespace=document_index.namespace_for(namespace),
+            )
+    except Exception as e:
+        logger.error(f"Failed to remove vectors of a failed push from index {index_name}: {e}")
+
+
+def remove_documents(
+        file_names: List[str],
+        index_name: str,
+        namespace: str,
+) -> None:
+    """Delete cataloged documents with their chunk and summary vectors
+
+    Used when a re-ingested file has no chunks of its own left to push, so
+    its earlier version is not superseded by a push.
+    """
+    document_index = DocumentIndexConfig()
+    for file_name in file_names:
+        if get_catalog_document(index_name, namespace, file_name) is None:
+            continue
+        delete_vectors(
+            ids=get_document_chunk_ids(index_name, namespace, file_name),
+            index_name=index_name,
+            namespace=namespace,
+        )
+        if document_index.enabled:
+            delete_vectors(
+                ids=[make_document_id(namespace, file_name)],
+                index_name=index_name,
+                namespace=document_index.namespace_for(namespace),
+            )
+        remove_catalog_document(index_name, namespace, file_name)
+        logger.info(f"Removed earlier version of {file_name} from namespace: {namespace}")
+
+
+def update_catalog(
+        texts: List,
+        chunk_ids: List[str],
+        index_name: str,
+        namespace: str,
+) -> bool:
+    """Record pushed documents and delete chunks a re-ingested file no longer produces
+
+    Returns False when the catalog could not be updated, in which case it no
+    longer matches the index and must be reported to the caller.
+    """
+    try:
+        stale_ids = record_documents(
+            texts=texts,
+            chunk_ids=chunk_ids,
+            index_name=index_name,
+            namespace=namespace,
+            embedding_model=get_index_embedding_model_name(),
+        )
+        delete_vectors(
+            ids=[chunk_id for ids in stale_ids.values() for chunk_id in ids],
+            index_name=index_name,
+            namespace=namespace,
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Failed to update document catalog, it no longer matches index {index_name}: {e}")
+        return False
+
+
 def push_to_database(
     texts: List,
     index_name: str = None,
     namespace: str = None,
-) -> bool:
+) -> PushToDatabaseResponseDto:
+    chunk_ids: List[str] = []
     try:
         config = PineconeConfig()
         config.index_name = index_name
         config.namespace = namespace
 
         meta_datas = [text.metadata for text in texts]
-        handle_pinecone_push(
+        chunk_ids = assign_chunk_ids(texts, namespace)
+        response = handle_pinecone_push(
             texts=texts,
             meta_datas=meta_datas,
             config=config,
+            ids=chunk_ids,
         )
 
         logger.info(f"Successfully pushed {len(texts)} documents to index: {index_name}")
-        return True
+        response.catalog_updated = update_catalog(texts, chunk_ids, index_name, namespace)
+        return response
 
     except Exception as e:
         logger.exception(f"Vector database operation failed: {str(e)}")
-        return False
+        if chunk_ids:
+            discard_uncataloged_vectors(texts, chunk_ids, index_name, namespace)
+        return PushToDatabaseResponseDto(status=False, message=str(e), index=index_name, namespace=namespace)
+
+
+async def apush_to_database(
+    texts: List,
+    index_name: str = None,
+    namespace: str = None,
+    timeout: Optional[float] = None,
+) -> PushToDatabaseResponseDto:
+    """Async push_to_database; cancellation and timeouts abort the push
+
+    Vectors written by an aborted or failed push that the catalog does not
+    list are deleted again, so they cannot outlive the failed ingest.
+    """
+    chunk_ids: List[str] = []
+    try:
+        config = PineconeConfig()
+        config.index_name = index_name
+        config.namespace = namespace
+
+        meta_datas = [text.metadata for text in texts]
+        chunk_ids = assign_chunk_ids(texts, namespace)
+        response = await asyncio.wait_for(
+            ahandle_pinecone_push(
+                texts=texts,
+                meta_datas=meta_datas,
+                config=config,
+                ids=chunk_ids,
+            ),
+            timeout=timeout,
+        )
+
+        logger.info(f"Successfully pushed {len(texts)} documents to index: {index_name}")
+        response.catalog_updated = await asyncio.to_thread(update_catalog, texts, chunk_ids, index_name, namespace)
+        return response
+
+    except asyncio.TimeoutError:
+        logger.error(f"Vector database push timed out after {timeout} seconds")
+        await asyncio.to_thread(discard_uncataloged_vectors, texts, chunk_ids, index_name, namespace)
+        return PushToDatabaseResponseDto(
+            status=False, message=f"Push timed out after {timeout} seconds", index=index_name, namespace=namespace
+        )
+
+    except asyncio.CancelledError:
+        if chunk_ids:
+            await asyncio.shield(asyncio.to_thread(discard_uncataloged_vectors, texts, chunk_ids, index_name, namespace))
+        raise
+
+    except Exception as e:
+        logger.exception(f"Vector database operation failed: {str(e)}")
+        if chunk_ids:
+            await asyncio.to_thread(discard_uncataloged_vectors, texts, chunk_ids, index_name, namespace)
+        return PushToDatabaseResponseDto(status=False, message=str(e), index=index_name, namespace=namespace)
+
+
+def delete_vectors(
+        ids: List[str],
+        index_name: str,
+        namespace: str,
+        batch_size: int = 1000,
+) -> int:
+    """Delete vectors by ID, in batches the Pinecone API accepts"""
+    if not ids:
+        return 0
+
+    loaded_index = initialize_pinecone().Index(index_name)
+    for start in range(0, len(ids), batch_size):
+        loaded_index.delete(ids=ids[start:start + batch_size], namespace=namespace)
+
+    logger.info(f"Deleted {len(ids)} vectors from index: {index_name}, namespace: {namespace}")
+    return len(ids)
 
 
 def load_index(
@@ -88,7 +481,7 @@ def load_index(
         # load a pinecone index
         return PineconeVectorStore.from_existing_index(
             index_name=index_name,
-            embedding=get_embedding_model(),
+            embedding=get_index_embedding_model(namespace),
             namespace=namespace,
         )
     except Exception as e:
@@ -101,9 +494,12 @@ async def get_related_docs_with_score(
     namespace: str,
     question: str,
     total_docs_to_retrieve: int = 10,
+    filters: Optional[Dict[str, Any]] = None,
 ) -> list[tuple[Document, float]]:
+    metadata_filter = build_metadata_filter(filters)
+
     try:
-        docsearch = load_index(index_name=index_name)
+        docsearch = load_index(index_name=index_name, namespace=namespace)
 
         if not docsearch:
             raise ValueError("Document search object is None")
@@ -112,6 +508,7 @@ async def get_related_docs_with_score(
             query=question,
             namespace=namespace,
             k=total_docs_to_retrieve,
+            filter=metadata_filter,
         )
         logger.info(f"Related docs retrieved: {len(related_docs_with_score)}")
         logger.debug(f"Related docs retrieved: {related_docs_with_score[:2]}")
@@ -122,6 +519,196 @@ async def get_related_docs_with_score(
         return []
 
 
+def normalise_scores(
+        docs_with_score: list[tuple[Document, float]],
+        source: RetrievalSource,
+) -> list[tuple[Document, float]]:
+    """Apply a source's score normalisation and weight so sources can be merged"""
+    if not docs_with_score:
+        return []
+
+    scores = [score for _, score in docs_with_score]
+    if source.normalization == "minmax":
+        low, high = min(scores), max(scores)
+        spread = high - low
+        scores = [(score - low) / spread if spread else 1.0 for score in scores]
+
+    return [(doc, score * source.weight) for (doc, _), score in zip(docs_with_score, scores)]
+
+
+def search_source_by_vector(
+        source: RetrievalSource,
+        embedding: List[float],
+        k: int,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        index_name: Optional[str] = None,
+) -> list[tuple[Document, float]]:
+    """Blocking search of one source; index_name is used when the source names none
+
+    Scores are relevance scores, as from the single-namespace searches.
+    """
+    namespace = source.namespace
+    docs_with_score = search_chunks_by_vector(
+        source.index_name or index_name,
+        namespace,
+        compress_vectors([embedding], namespace)[0],
+        k,
+        metadata_filter,
+    )
+    for doc, _ in docs_with_score:
+        doc.metadata["namespace"] = namespace
+    return docs_with_score
+
+
+async def get_related_docs_from_sources(
+        sources: List[RetrievalSource],
+        question: str,
+        total_docs_to_retrieve: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        index_name: Optional[str] = None,
+) -> list[tuple[Document, float]]:
+    """Query several (index, namespace) pairs concurrently with one query embedding
+
+    Each source, including loading its index, runs in a worker thread under its
+    own timeout; sources that fail or time out are skipped (a timed-out thread
+    finishes in the background). Sources without an index_name use the one
+    given here. Scores are normalised per source and merged into a global top-k.
+    """
+    metadata_filter = build_metadata_filter(filters)
+
+    try:
+        embedding = await get_embedding_model().aembed_query(question)
+
+        results = await asyncio.gather(
+            *[
+                asyncio.wait_for(
+                    asyncio.to_thread(
+                        search_source_by_vector,
+                        source,
+                        embedding,
+                        total_docs_to_retrieve,
+                        metadata_filter,
+                        index_name,
+                    ),
+                    timeout=source.timeout,
+                )
+                for source in sources
+            ],
+            return_exceptions=True,
+        )
+
+        candidates = []
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                reason = "timed out" if isinstance(result, asyncio.TimeoutError) else str(result)
+                logger.warning(f"Skipping namespace {source.namespace} in retrieval: {reason}")
+                continue
+            candidates.extend(normalise_scores(result, source))
+
+        related_docs_with_score = heapq.nlargest(
+            total_docs_to_retrieve, candidates, key=lambda doc_with_score: doc_with_score[1]
+        )
+        logger.info(f"Related docs retrieved from {len(sources)} sources: {len(related_docs_with_score)}")
+        return related_docs_with_score
+
+    except Exception as e:
+        logger.error(f"Failed to get related docs from sources: {e}")
+        return []
+
+
+DOCUMENT_LEVEL_FIELDS = {"file_name", "original_file_name", "file_type", "title"}
+
+
+def search_chunks_by_vector(
+        index_name: str,
+        namespace: str,
+        embedding: List[float],
+        k: int,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+) -> list[tuple[Document, float]]:
+    """Blocking chunk search by vector, scored on the same relevance scale as the flat search"""
+    docsearch = load_index(index_name=index_name, namespace=namespace)
+    if not docsearch:
+        raise ValueError("Document search object is None")
+
+    relevance = docsearch._select_relevance_score_fn()
+    return [
+        (doc, relevance(score))
+        for doc, score in docsearch.similarity_search_by_vector_with_score(
+            embedding, k=k, filter=metadata_filter, namespace=namespace,
+        )
+    ]
+
+
+async def get_related_docs_hierarchical(
+        index_name: str,
+        namespace: str,
+        question: str,
+        total_docs_to_retrieve: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        top_documents: Optional[int] = None,
+) -> list[tuple[Document, float]]:
+    """Pick the closest files by summary vector, then search chunks only within them
+
+    Scores are relevance scores, as from the flat search. Falls back to a flat
+    chunk search when the namespace has no summary vectors or no chunk of the
+    selected files matches the filters.
+    """
+    metadata_filter = build_metadata_filter(filters)
+    document_filter = build_metadata_filter(
+        {field: condition for field, condition in (filters or {}).items() if field in DOCUMENT_LEVEL_FIELDS}
+    )
+    document_index = DocumentIndexConfig()
+    index_name = index_name or PineconeConfig().index_name
+
+    try:
+        embedding = await get_index_embedding_model(namespace).aembed_query(question)
+
+        loaded_index = initialize_pinecone().Index(index_name)
+        matches = (await asyncio.to_thread(
+            loaded_index.query,
+            vector=embedding,
+            top_k=top_documents or document_index.top_documents,
+            namespace=document_index.namespace_for(namespace),
+            filter=document_filter,
+            include_metadata=True,
+        ))["matches"]
+        file_names = [match["metadata"]["file_name"] for match in matches if match.get("metadata")]
+
+        related_docs_with_score = []
+        if file_names:
+            chunk_filter = {"file_name": {"$in": file_names}}
+            if metadata_filter:
+                chunk_filter = {"$and": [metadata_filter, chunk_filter]}
+
+            related_docs_with_score = await asyncio.to_thread(
+                search_chunks_by_vector,
+                index_name,
+                namespace,
+                embedding,
+                total_docs_to_retrieve,
+                chunk_filter,
+            )
+
+        if not related_docs_with_score:
+            reason = "no matching chunks in the selected documents" if file_names else "no document vectors"
+            logger.info(f"Hierarchical search of namespace {namespace} found {reason}, using flat chunk search")
+            return await get_related_docs_with_score(
+                index_name=index_name,
+                namespace=namespace,
+                question=question,
+                total_docs_to_retrieve=total_docs_to_retrieve,
+                filters=filters,
+            )
+
+        logger.info(f"Related docs retrieved from {len(file_names)} documents: {len(related_docs_with_score)}")
+        return related_docs_with_score
+
+    except Exception as e:
+        logger.error(f"Failed to get related docs hierarchically: {e}")
+        return []
+
+
 def create_pinecone_index(pc: Pinecone, config: PineconeConfig) -> None:
     try:
         pc.create_index(
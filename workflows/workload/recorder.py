@@ -0,0 +1,139 @@
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from loguru import logger
+
+
+TRACE_PATH_ENV = "WORKLOAD_TRACE_PATH"
+
+_suspended: ContextVar[bool] = ContextVar("workload_recording_suspended", default=False)
+
+
+class WorkloadRecorder:
+    """Appends request shapes and timings to a JSONL trace file"""
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._last_arrival: Optional[float] = None
+
+    def arrival(self) -> tuple[float, Optional[float]]:
+        """Return the arrival timestamp and the gap since the previous request"""
+        with self._lock:
+            now = time.time()
+            gap = None if self._last_arrival is None else now - self._last_arrival
+            self._last_arrival = now
+            return now, gap
+
+    def write(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(event, default=str) + "\n")
+
+
+_recorders: Dict[str, WorkloadRecorder] = {}
+
+
+def get_recorder() -> Optional[WorkloadRecorder]:
+    """Recorder for the trace file named by WORKLOAD_TRACE_PATH, if recording is enabled"""
+    path = os.getenv(TRACE_PATH_ENV)
+    if not path or _suspended.get():
+        return None
+    if path not in _recorders:
+        _recorders[path] = WorkloadRecorder(path)
+    return _recorders[path]
+
+
+@contextmanager
+def suspend_recording() -> Iterator[None]:
+    """Skip recording for calls made in this context, e.g. while replaying a trace"""
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def describe_ingest(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    request = arguments["request"]
+    content = getattr(request, "content", None)
+    return {
+        "namespace": request.namespace,
+        "file_type": request.file_type,
+        "size_bytes": len(content) if content is not None else None,
+        "source": "memory" if content is not None else "url",
+    }
+
+
+def describe_chat(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    question = arguments.get("question") or ""
+    return {
+        "namespace": arguments.get("namespace"),
+        "index_name": arguments.get("index_name"),
+        "question": question,
+        "question_chars": len(question),
+        "language": arguments.get("language"),
+        "chat_turns": len(arguments.get("chat_context") or []),
+        "top_k": arguments.get("top_k"),
+        "filters": arguments.get("filters"),
+        "sources": len(arguments.get("sources") or []) or None,
+    }
+
+
+def record_workload(kind: str, describe: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Callable:
+    """Record each call of an async route into the workload trace
+
+    Recording is a no-op unless WORKLOAD_TRACE_PATH is set. Failures while
+    recording are logged and never affect the wrapped call.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = get_recorder()
+            if recorder is None:
+                return await func(*args, **kwargs)
+
+            arrival, gap = recorder.arrival()
+            started = time.perf_counter()
+            success, error = False, None
+            try:
+                result = await func(*args, **kwargs)
+                if isinstance(result, dict):
+                    success = bool(result.get("success", True))
+                    if not success:
+                        error = result.get("error") or result.get("message")
+                else:
+                    success = True
+                return result
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                try:
+                    bound = signature.bind_partial(*args, **kwargs)
+                    bound.apply_defaults()
+                    recorder.write({
+                        "kind": kind,
+                        "arrival": arrival,
+                        "gap_s": gap,
+                        "duration_s": time.perf_counter() - started,
+                        "success": success,
+                        "error": error,
+                        **describe(bound.arguments),
+                    })
+                except Exception as e:
+                    logger.error(f"Failed to record workload event for {func.__name__}: {e}")
+
+        return wrapper
+
+    return decorator
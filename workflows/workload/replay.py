@@ -0,0 +1,189 @@
+"""Replay a recorded workload trace and report throughput and latency.
+
+Usage:
+    python -m workflows.workload.replay trace.jsonl --speed 2 --concurrency 8
+    python -m workflows.workload.replay trace.jsonl --target real --output report.json
+    python -m workflows.workload.replay trace.jsonl --target real --kind ingest --namespace-prefix loadtest__
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from workflows.workload.recorder import suspend_recording
+
+
+DEFAULT_NAMESPACE_PREFIX = "replay__"
+
+
+@dataclass
+class ReplayResult:
+    kind: str
+    scheduled_at: float
+    queue_delay_s: float
+    latency_s: float
+    success: bool
+
+
+def load_trace(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as handle:
+        events = [json.loads(line) for line in handle if line.strip()]
+    return sorted(events, key=lambda event: event["arrival"])
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def run_stand_in(event: Dict[str, Any]) -> bool:
+    """Local stand-in for the providers: wait as long as the recorded call took"""
+    await asyncio.sleep(event.get("duration_s") or 0.0)
+    return bool(event.get("success", True))
+
+
+async def run_real(event: Dict[str, Any], namespace_prefix: str = DEFAULT_NAMESPACE_PREFIX) -> bool:
+    """Send the event to the real ingest or chat route
+
+    Synthetic ingests are written to the recorded namespace with
+    namespace_prefix prepended, so replays never add content to real
+    tenant namespaces unless the prefix is empty.
+    """
+    if event["kind"] == "ingest":
+        from workflows.injest.routes import injest_doc
+        from workflows.models import InjestRequestDto
+
+        size = event.get("size_bytes") or 4096
+        content = (b"Synthetic replay content for load generation. " * (size // 47 + 1))[:size]
+        result = await injest_doc(InjestRequestDto(
+            content=content,
+            file_name="replay.txt",
+            original_file_name="replay.txt",
+            file_type="txt",
+            namespace=f"{namespace_prefix}{event.get('namespace') or 'dev'}",
+        ))
+    else:
+        from workflows.retreival.routes import get_response
+
+        result = await get_response(
+            question=event.get("question") or "What is this document about?",
+            language=event.get("language") or "en",
+            namespace=event.get("namespace"),
+            index_name=event.get("index_name"),
+            filters=event.get("filters"),
+            top_k=event.get("top_k") or 10,
+        )
+    return bool(result.get("success"))
+
+
+async def replay(
+        events: List[Dict[str, Any]],
+        speed: float = 1.0,
+        concurrency: int = 8,
+        target: str = "stand-in",
+        namespace_prefix: str = DEFAULT_NAMESPACE_PREFIX,
+) -> List[ReplayResult]:
+    """Play events back at their recorded offsets divided by speed
+
+    Workload recording is suspended, so a replay never appends to a trace.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handler(event: Dict[str, Any]) -> bool:
+        if target == "real":
+            return await run_real(event, namespace_prefix)
+        return await run_stand_in(event)
+
+    first_arrival = events[0]["arrival"] if events else 0.0
+    start = time.perf_counter()
+
+    async def play(event: Dict[str, Any]) -> ReplayResult:
+        offset = (event["arrival"] - first_arrival) / speed
+        await asyncio.sleep(max(0.0, start + offset - time.perf_counter()))
+
+        scheduled = start + offset
+        async with semaphore:
+            acquired = time.perf_counter()
+            try:
+                success = await handler(event)
+            except Exception as e:
+                logger.error(f"Replay of {event['kind']} event failed: {e}")
+                success = False
+            return ReplayResult(
+                kind=event["kind"],
+                scheduled_at=offset,
+                queue_delay_s=max(0.0, acquired - scheduled),
+                latency_s=time.perf_counter() - acquired,
+                success=success,
+            )
+
+    with suspend_recording():
+        return list(await asyncio.gather(*[play(event) for event in events]))
+
+
+def summarise(results: List[ReplayResult], elapsed: float) -> Dict[str, Any]:
+    def stats(subset: List[ReplayResult]) -> Dict[str, Any]:
+        latencies = [result.latency_s for result in subset]
+        delays = [result.queue_delay_s for result in subset]
+        return {
+            "requests": len(subset),
+            "throughput_rps": len(subset) / elapsed if elapsed else None,
+            "error_rate": sum(not result.success for result in subset) / len(subset) if subset else None,
+            "latency_s": {f"p{pct}": percentile(latencies, pct) for pct in (50, 90, 95, 99)}
+            | {"max": max(latencies, default=None)},
+            "queue_delay_s": {f"p{pct}": percentile(delays, pct) for pct in (50, 95, 99)}
+            | {"max": max(delays, default=None)},
+        }
+
+    report = {"elapsed_s": elapsed, "overall": stats(results)}
+    for kind in sorted({result.kind for result in results}):
+        report[kind] = stats([result for result in results if result.kind == kind])
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Replay a recorded chat/ingest workload trace")
+    parser.add_argument("trace", help="JSONL trace written with WORKLOAD_TRACE_PATH")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier (2 = twice as fast)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument("--target", choices=["stand-in", "real"], default="stand-in",
+                        help="Replay against local stand-ins or the real providers")
+    parser.add_argument("--kind", choices=["chat", "ingest"], help="Only replay one kind of request")
+    parser.add_argument("--namespace-prefix", default=DEFAULT_NAMESPACE_PREFIX,
+                        help="Prefix for namespaces that real ingests write to; pass \"\" to use the recorded ones")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    events = load_trace(args.trace)
+    if args.kind:
+        events = [event for event in events if event["kind"] == args.kind]
+    logger.info(f"Replaying {len(events)} events at {args.speed}x with concurrency {args.concurrency}")
+
+    started = time.perf_counter()
+    results = asyncio.run(replay(
+        events,
+        speed=args.speed,
+        concurrency=args.concurrency,
+        target=args.target,
+        namespace_prefix=args.namespace_prefix,
+    ))
+    report = summarise(results, time.perf_counter() - started)
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()